@@ -0,0 +1,16 @@
+"""Helper module for f451 Labs applications.
+
+Single home for the TOML parser selection so that the modules which
+parse settings files don't each repeat the version check. 'tomllib'
+is stdlib from Python 3.11; older interpreters get the 'tomli'
+backport under the same name.
+"""
+
+import sys
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+__all__ = ['tomllib']
@@ -18,16 +18,23 @@ Dependencies:
 
 import time
 
+from bisect import bisect_left
+from collections import deque
+from functools import cached_property, lru_cache
+
+import numpy as np
+
 from rich import box
 from rich.console import Console
 from rich.layout import Layout
 from rich.progress import Progress, TextColumn, BarColumn, TaskProgressColumn
-from rich.text import Text
+from rich.text import Span, Text
 from rich.rule import Rule
 from rich.status import Status
 from rich.table import Table
 
 from sparklines import sparklines
+from termcolor import colored
 
 import f451_common.common as f451Common
 
@@ -79,13 +86,25 @@ MAX_PROGBAR = 100           # Use 100% as max for progress bars
 #    H E L P E R   C L A S S E S   &   F U N C T I O N S
 # =========================================================
 class Logo:
-    """Render fancy logo."""
+    """Render fancy logo.
+
+    NOTE: Rendering the ASCII art (via pyFiglet) is relatively
+          expensive, so we defer it until the logo is actually
+          displayed (or its row count is needed) and then keep
+          the rendered string around.
+    """
 
     def __init__(self, width, namePlain, nameRender, verNum):
-        self._render = f451Common.make_logo(width, nameRender, f"v{verNum}")
+        self._width = width
+        self._nameRender = nameRender
+        self._verNum = verNum
         self._plain = f"{namePlain} - v{verNum}"
 
-    @property
+    @cached_property
+    def _render(self):
+        return f451Common.make_logo(self._width, self._nameRender, f"v{self._verNum}")
+
+    @cached_property
     def rows(self):
         return max(self._render.count('\n'), 1) if self._render else 1
 
@@ -103,6 +122,192 @@ class Logo:
         return f"{type(self).__name__}(plain={self._plain!r})"
 
 
+SPARK_BLOCKS = ' ▁▂▃▄▅▆▇█'   # Unicode blocks used for sparkline graphs
+ANSI_RESET = '\x1b[0m'
+
+
+@lru_cache(maxsize=32)
+def _ansi_color_prefix(color):
+    """Get ANSI escape prefix for a given 'termcolor' color name.
+
+    We let 'termcolor' generate the sequence so that we stay compatible
+    with its color handling (incl. 'NO_COLOR', non-tty output, etc.).
+    """
+    return colored('|', color).split('|')[0]
+
+
+@lru_cache(maxsize=32)
+def _spark_char_table(color):
+    """Get (cached) table of fully-assembled colored block characters.
+
+    Pre-concatenating 'prefix + block + reset' per color means the
+    colored sparkline path only does table lookups and one final
+    'join', instead of building each 3-part character string anew.
+    """
+    prefix = _ansi_color_prefix(color)
+    if not prefix:
+        return tuple(SPARK_BLOCKS)
+
+    return tuple(f'{prefix}{ch}{ANSI_RESET}' for ch in SPARK_BLOCKS)
+
+
+@lru_cache(maxsize=64)
+def _parse_spark_emph(emph):
+    """Parse 'color:<eq|gt|lt>:<value>' emphasis rules once per limits set."""
+    rules = []
+    for em in emph:
+        color, op, val = em.split(':')
+        rules.append((color, op, float(val)))
+
+    return tuple(rules)
+
+
+def _fast_sparkline(values, minimum=None, maximum=None, emph=None):
+    """Render single-line sparkline graph without the 'sparklines' library
+
+    The 'sparklines' library loops over every value in Python to bucket
+    it into one of 8 block characters and then colors each character via
+    'termcolor'. That's a lot of interpreter overhead for something we
+    re-render for every data row on every refresh. This function does
+    the same bucketing in a single vectorized NumPy pass and uses
+    pre-computed (cached) ANSI prefixes for the coloring.
+
+    NOTE: This replicates the library's output for our use case (single
+          line, non-negative data). We fall back to the library for
+          mixed positive/negative data, which it renders as a split
+          graph.
+
+    Args:
+        values: 'list' of numeric values (no 'None' values)
+        minimum: (optional) lower bound for graph
+        maximum: (optional) upper bound for graph
+        emph: (optional) 'list' with 'color:<op>:<value>' emphasis rules
+
+    Returns:
+        'str' with sparkline graph (incl. ANSI color codes as needed)
+    """
+    if len(values) == 0:
+        return ''
+
+    arr = np.asarray(values, dtype=np.float64)
+    mn = float(arr.min()) if minimum is None else minimum
+    mx = float(arr.max()) if maximum is None else maximum
+
+    # Mixed positive/negative data renders as a split graph -- punt
+    # that (rare) case to the 'sparklines' library
+    if float(arr.min()) < 0:
+        return sparklines(list(values), emph=list(emph) if emph else None, num_lines=1, minimum=minimum, maximum=maximum)[-1]
+
+    # Bucket all values into range 1-8 in one vectorized pass
+    span = mx - mn
+    if span > 0:
+        buckets = np.rint((np.clip(arr, mn, mx) - mn) * 7.0 / span + 1.0).astype(np.intp)
+    else:
+        buckets = np.full(arr.size, 4, dtype=np.intp)
+
+    # Resolve emphasis rules (in order -- last matching rule wins)
+    colorIdx = None
+    rules = _parse_spark_emph(tuple(emph)) if emph else ()
+    if rules:
+        colorIdx = np.full(arr.size, -1, dtype=np.intp)
+        for indx, (_, op, val) in enumerate(rules):
+            if op == 'gt':
+                mask = arr > val
+            elif op == 'ge':
+                mask = arr >= val
+            elif op == 'lt':
+                mask = arr < val
+            elif op == 'le':
+                mask = arr <= val
+            else:  # 'eq'
+                mask = arr == val
+            colorIdx[mask] = indx
+
+    # Plain graph if no values need emphasis
+    if colorIdx is None or not (colorIdx >= 0).any():
+        return ''.join(SPARK_BLOCKS[b] for b in buckets)
+
+    whiteTbl = _spark_char_table('white')
+    return ''.join(
+        (_spark_char_table(rules[c][0]) if c >= 0 else whiteTbl)[b]
+        for c, b in zip(colorIdx, buckets)
+    )
+
+
+@lru_cache(maxsize=32)
+def _blank_currval_text(unit):
+    """Get (cached) 'blank value' cell text for a given unit
+
+    The 'blank' and 'error' cell strings never change, so we build
+    the 'Text' objects once per unit instead of re-formatting them
+    on every refresh.
+    """
+    return Text(f'{CHAR_DIR_DEF} {VAL_BLANK_STR:>8} {unit}', style=COLOR_DEF)
+
+
+_ERROR_TEXT = Text(f'{CHAR_DIR_DEF} {VAL_ERROR_STR:>8}', style=COLOR_ERROR)
+
+
+@lru_cache(maxsize=64)
+def _compile_limits(limits, colorMap):
+    """Compile limits into thresholds + colors for fast color lookup
+
+    The limits for a data type are effectively immutable, so we round
+    the two thresholds we care about once and pair them with an ordered
+    color tuple. A data point color then resolves with a single
+    'bisect' call instead of 'all()', 'round()', and chained compares
+    on every row on every refresh.
+
+    Args:
+        limits: 'tuple' with limits -- see SenseHat module for details
+        colorMap: 'TriColor' named tuple with color set
+
+    Return:
+        '(thresholds, colors)' tuple, or 'None' if limits are incomplete
+    """
+    if not all(limits):
+        return None
+
+    thresholds = (round(limits[1], 1), round(limits[2], 1))
+
+    return thresholds, (colorMap.low, colorMap.normal, colorMap.high)
+
+
+@lru_cache(maxsize=64)
+def _sparkline_colors(limits, colorMap):
+    """Create color mapping for sparkline graphs
+
+    This function creates the 'color' list which allows
+    the 'sparklines' library to add add correct ANSI
+    color codes to the graph.
+
+    NOTE: Limits rarely (if ever) change between display refreshes,
+          so we cache the formatted strings per limits set instead
+          of rebuilding them for every row on every frame.
+
+    Args:
+        limits: 'tuple' with limits -- see SenseHat module for details
+        colorMap: 'TriColor' named tuple with color set
+
+    Return:
+        'list' with definitions for 'emph' param of 'sparklines' method
+    """
+    # fmt: off
+    colors = None
+
+    if all(limits):
+        colors = [
+            f'{colorMap.high}:gt:{round(limits[2], 1)}',    # High   # type: ignore
+            f'{colorMap.normal}:eq:{round(limits[2], 1)}',  # Normal # type: ignore
+            f'{colorMap.normal}:lt:{round(limits[2], 1)}',  # Normal # type: ignore
+            f'{colorMap.low}:eq:{round(limits[1], 1)}',     # Low    # type: ignore
+            f'{colorMap.low}:lt:{round(limits[1], 1)}',     # Low    # type: ignore
+        ]
+
+    return colors
+    # fmt: on
+
+
 def prep_data(inData, dataTypes, deltaFactor=APP_DELTA_FACTOR, labelsOnly=False, conWidth=APP_2COL_MIN_WIDTH):
     """Prep data for display in terminal
 
@@ -161,61 +366,8 @@ def prep_data(inData, dataTypes, deltaFactor=APP_DELTA_FACTOR, labelsOnly=False,
     """
     outData = []
 
-    def _sparkline_colors(limits, customColors=None):
-        """Create color mapping for sparkline graphs
-
-        This function creates the 'color' list which allows
-        the 'sparklines' library to add add correct ANSI
-        color codes to the graph.
-
-        Args:
-            limits: list with limits -- see SenseHat module for details
-            customColors: (optional) custom color map
-
-        Return:
-            'list' with definitions for 'emph' param of 'sparklines' method
-        """
-        # fmt: off
-        colors = None
-
-        if all(limits):
-            colorMap = f451Common.get_tri_colors(customColors)
-
-            colors = [
-                f'{colorMap.high}:gt:{round(limits[2], 1)}',    # High   # type: ignore
-                f'{colorMap.normal}:eq:{round(limits[2], 1)}',  # Normal # type: ignore
-                f'{colorMap.normal}:lt:{round(limits[2], 1)}',  # Normal # type: ignore
-                f'{colorMap.low}:eq:{round(limits[1], 1)}',     # Low    # type: ignore
-                f'{colorMap.low}:lt:{round(limits[1], 1)}',     # Low    # type: ignore
-            ]
-
-        return colors
-        # fmt: on
-
-    def _dataPt_color(val, limits, default='', customColors=None):
-        """Determine color mapping for specific value
-
-        Args:
-            val: value to check
-            limits: list with limits -- see SenseHat module for details
-            default: (optional) default color name string
-            customColors: (optional) custom color map
-
-        Return:
-            'list' with definitions for 'emph' param of 'sparklines' method
-        """
-        color = default
-        colorMap = f451Common.get_tri_colors(customColors)
-
-        if val is not None and all(limits):
-            if val > round(limits[2], 1):
-                color = colorMap.high
-            elif val <= round(limits[1], 1):
-                color = colorMap.low
-            else:
-                color = colorMap.normal
-
-        return color
+    # Get color set once -- it's the same for every data row
+    colorMap = f451Common.get_tri_colors()
 
     # Process each data row and create a new data structure that we can use
     # for displaying all necessary data in the terminal.
@@ -240,43 +392,50 @@ def prep_data(inData, dataTypes, deltaFactor=APP_DELTA_FACTOR, labelsOnly=False,
                 outData.append(dataSet)
                 continue
 
-            # Data slice we can display in table row
+            # Data slice we can display in table row. Data queues are
+            # (bounded) 'deque' objects -- see 'common.make_history' --
+            # and trimming via a fixed-size 'deque' keeps the tail in
+            # one C-level pass instead of a full list copy plus slice.
             graphWidth = min(int(conWidth / 2), 40)
-            dataSlice = list(row['data'])[-graphWidth:]
+            dataSlice = list(deque(row['data'], maxlen=graphWidth))
 
             # Get filtered data to calculate min/max. Note that 'valid' data
-            # will have only valid values. Any invalid values would have been
-            # replaced with 'None' values. We can display this set using the
-            # 'sparklines' library. We continue refining the data by removing
-            # all 'None' values to get a 'clean' set, which we can use to
-            # establish min/max values for the set.
-            dataValid = [i if f451Common.is_valid(i, row['valid']) else None for i in dataSlice]
-            dataClean = [i for i in dataValid if i is not None]
+            # will have only valid values. Any invalid values are masked out
+            # (and later replaced with 0's for the sparkline graphs). We use
+            # 'is_valid_array' to filter the whole slice in a single
+            # vectorized pass instead of checking each value in Python.
+            # Missing ('None') values are masked out as well.
+            arr = np.array(dataSlice, dtype=np.float64)
+            mask = f451Common.is_valid_array(arr, row['valid'])
+            dataClean = arr[mask]
 
             # We set 'OK' flag to 'True' if current data point is valid or
             # missing (i.e. None).
-            dataPt = dataSlice[-1] if f451Common.is_valid(dataSlice[-1], row['valid']) else None
+            dataPt = dataSlice[-1] if mask[-1] else None
             dataPtOK = dataPt or dataSlice[-1] is None
 
             # We determine up/down/sideways trend by looking at delate between
             # current value and previous value. If current and/or previous value
             # is 'None' for whatever reason, then we assume 'sideways' (0)trend.
-            dataPtPrev = (
-                dataSlice[-2] if f451Common.is_valid(dataSlice[-2], row['valid']) else None
-            )
+            dataPtPrev = dataSlice[-2] if mask[-2] else None
             dataPtDelta = f451Common.get_delta_range(dataPt, dataPtPrev, deltaFactor)
 
             # Update data set
-            dataSet['sparkData'] = [0 if i is None else i for i in dataValid]
-            dataSet['sparkColors'] = _sparkline_colors(row['limits'])
+            dataSet['sparkData'] = np.where(mask, arr, 0.0)
+            dataSet['sparkColors'] = _sparkline_colors(tuple(row['limits']), colorMap)
             dataSet['sparkMinMax'] = (
-                (min(dataClean), max(dataClean)) if any(dataClean) else (None, None)
+                (float(dataClean.min()), float(dataClean.max()))
+                if dataClean.size
+                else (None, None)
             )
 
             dataSet['dataPt'] = dataPt
             dataSet['dataPtOK'] = dataPtOK
             dataSet['dataPtDelta'] = dataPtDelta
-            dataSet['dataPtColor'] = _dataPt_color(dataPt, row['limits'])
+            limitsCompiled = _compile_limits(tuple(row['limits']), colorMap)
+            if dataPt is not None and limitsCompiled is not None:
+                thresholds, limitColors = limitsCompiled
+                dataSet['dataPtColor'] = limitColors[bisect_left(thresholds, dataPt)]
 
             outData.append(dataSet)
 
@@ -295,9 +454,13 @@ class BaseUI:
         self._active = False
         self._progBar = None
         self._progTaskID = None
+        self._table = None
+        self._statusCells = None
+        self._lastDataSig = None
         self.logo = None
-        self.show24h = False    # Show 24-hour time?
-        self.showLocal = True   # Show local time?
+        self._show24h = False   # Show 24-hour time?
+        self._showLocal = True  # Show local time?
+        self._update_time_fmt()
         self.statusHdr = HDR_STATUS
         self.statusLblNext = STATUS_LBL_NEXT
         self.statusLblLast = STATUS_LBL_LAST
@@ -328,11 +491,39 @@ class BaseUI:
     @property
     def statusbar(self):
          """Provide hook to Rich 'status'"""
-         return self._layout['actCurrent'] if self._active else None
+         return self._statusCells[3] if self._active else None
+
+    @property
+    def show24h(self):
+        return self._show24h
+
+    @show24h.setter
+    def show24h(self, val):
+        self._show24h = val
+        self._update_time_fmt()
+
+    @property
+    def showLocal(self):
+        return self._showLocal
+
+    @showLocal.setter
+    def showLocal(self, val):
+        self._showLocal = val
+        self._update_time_fmt()
+
+    def _update_time_fmt(self):
+        """Resolve time format and conversion function once
+
+        '_make_time_str' can be called several times per status update,
+        so we resolve the format string and 'localtime' vs 'gmtime'
+        choice here (whenever the flags change) instead of re-checking
+        both flags on every call.
+        """
+        self._timeFmt = '%H:%M:%S' if self._show24h else '%I:%M:%S %p'
+        self._timeFn = time.localtime if self._showLocal else time.gmtime
 
     def _make_time_str(self, t):
-        timeFmtStr = '%H:%M:%S' if self.show24h else '%I:%M:%S %p'
-        return time.strftime(timeFmtStr, time.localtime(t) if self.showLocal else time.gmtime(t))
+        return time.strftime(self._timeFmt, self._timeFn(t))
 
     @staticmethod
     def _make_footer(appName, width, customColors=None):
@@ -371,96 +562,94 @@ class BaseUI:
 
     # fmt: off
     @staticmethod
-    def _render_table(data, labelsOnly=False):
-        """Make a new table
-
-        This is a beefy function and (re-)renders the whole table
-        on each update so that we get that real-time update feel.
-
+    def _prep_currval_str(data, labelsOnly=False):
+        """Prep string for displaying current/last data point
+
+        This is a formatted string with a data value and unit of
+        measure. The largest value will be 4 digits + 2 decimals.
+        We also want values to be right-justfied and align on the
+        decimal point.
+
+        -->|        |<--
+           |12345678|
+        ---|--------|---
+           |1,234.56|      <- Need min 8 char width for data values
+           |    1.23|
+
+        NOTE: We display '--' if value is 'None' and status is 'ok' 
+            as that represents a 'missing' value. But we display 
+            'ERROR' if value is 'None' and status is not 'ok' as
+            that indicates an invalid value. Both cases are shown
+            as gaps in sparkline graph.   
+        
         Args:
-            data: 'list' of data rows, each with a specific data set render
-            labelsOnly: 'bool' if 'True' then we only render labels and no data
+            data: 'dict' with data point value and attributes
+            labelsOnly: 'bool' if 'True' then we do not generate 'current value' string
 
         Returns:
-            'Table' with data
+            'Text' object with formatted 'current value'
         """
+        if labelsOnly or (data['dataPt'] is None and data['dataPtOK']):
+            return _blank_currval_text(data['unit'])
+        elif data['dataPt'] is None and not data['dataPtOK']:
+            return _ERROR_TEXT
+
+        if data['dataPtDelta'] > 0:
+            dirChar = CHAR_DIR_UP
+        elif data['dataPtDelta'] < 0:
+            dirChar = CHAR_DIR_DWN
+        else:
+            dirChar = CHAR_DIR_EQ
 
-        def _prep_currval_str(data, labelsOnly=False):
-            """Prep string for displaying current/last data point
-
-            This is a formatted string with a data value and unit of
-            measure. The largest value will be 4 digits + 2 decimals.
-            We also want values to be right-justfied and align on the
-            decimal point.
-
-            -->|        |<--
-               |12345678|
-            ---|--------|---
-               |1,234.56|      <- Need min 8 char width for data values
-               |    1.23|
-
-            NOTE: We display '--' if value is 'None' and status is 'ok' 
-                as that represents a 'missing' value. But we display 
-                'ERROR' if value is 'None' and status is not 'ok' as
-                that indicates an invalid value. Both cases are shown
-                as gaps in sparkline graph.   
-            
-            Args:
-                data: 'dict' with data point value and attributes
-                labelsOnly: 'bool' if 'True' then we do not generate 'current value' string
-
-            Returns:
-                'Text' object with formatted 'current value'
-            """
-            text = Text()
-            dirChar = CHAR_DIR_DEF
-
-            if labelsOnly or (data['dataPt'] is None and data['dataPtOK']):
-                text.append(f"{dirChar} {VAL_BLANK_STR:>8} {data['unit']}", COLOR_DEF)
-            elif data['dataPt'] is None and not data['dataPtOK']:
-                text.append(f"{dirChar} {VAL_ERROR_STR:>8}", COLOR_ERROR)
-            else:
-                if data['dataPtDelta'] > 0:
-                    dirChar = CHAR_DIR_UP
-                elif data['dataPtDelta'] < 0:
-                    dirChar = CHAR_DIR_DWN
-                else:
-                    dirChar = CHAR_DIR_EQ
-
-                text.append(
-                    f"{dirChar} {data['dataPt']:>8,.2f} {data['unit']}",
-                    data['dataPtColor']
-                )
+        return Text(
+            f"{dirChar} {data['dataPt']:>8,.2f} {data['unit']}",
+            style=data['dataPtColor']
+        )
 
-            return text
+    @staticmethod
+    def _prep_sparkline_str(data, labelsOnly):
+        """Prep sparkline graph string
 
-        def _prep_sparkline_str(data, labelsOnly):
-            """Prep sparkline graph string
+        NOTE: 'sparklines' library will return string with ANSI color 
+            codes when used with 'termcolors' library.
 
-            NOTE: 'sparklines' library will return string with ANSI color 
-                codes when used with 'termcolors' library.
+        Args:
+            data: 'dict' with data point value and attributes
+            labelsOnly: 'bool' if 'True' then we do not generate 'current value' string
 
-            Args:
-                data: 'dict' with data point value and attributes
-                labelsOnly: 'bool' if 'True' then we do not generate 'current value' string
+        Returns:
+            'Text' object with formatted 'current value'
+        """
+        if labelsOnly or not len(data['sparkData']):
+            return ''
+        else:
+            return Text.from_ansi(
+                _fast_sparkline(
+                    data['sparkData'],
+                    minimum=data['sparkMinMax'][0],
+                    maximum=data['sparkMinMax'][1],
+                    emph=data['sparkColors'],
+                ),
+                justify="center"
+            )
 
-            Returns:
-                'Text' object with formatted 'current value'
-            """
-            if labelsOnly or not data['sparkData']:
-                return ''
-            else:
-                return Text.from_ansi(
-                    sparklines(
-                        data['sparkData'], 
-                        emph=data['sparkColors'], 
-                        num_lines=1, 
-                        minimum=data['sparkMinMax'][0],
-                        maximum=data['sparkMinMax'][1]
-                    )[-1], 
-                    justify="center"
-                )
+    @staticmethod
+    def _render_table(data, labelsOnly=False):
+        """Make a new table
+
+        This renders a complete new table with columns and rows. We
+        use this to build the initial table during setup, and to
+        rebuild it if the row structure changes. Regular data-only
+        refreshes update the existing table cells in place instead
+        (see '_update_table').
+
+        Args:
+            data: 'list' of data rows, each with a specific data set render
+            labelsOnly: 'bool' if 'True' then we only render labels and no data
 
+        Returns:
+            'Table' with data
+        """
         # Build a table
         table = Table(
             show_header=True,
@@ -497,8 +686,8 @@ class BaseUI:
             for row in data:
                 table.add_row(
                     row['label'],                           # 1st col: label
-                    _prep_currval_str(row, labelsOnly),     # 2nd col: current value
-                    _prep_sparkline_str(row, labelsOnly)    # 3rd col: sparkline
+                    BaseUI._prep_currval_str(row, labelsOnly),      # 2nd col: current value
+                    BaseUI._prep_sparkline_str(row, labelsOnly)     # 3rd col: sparkline
                 )
         else:
             table.add_row('', '', '')
@@ -506,6 +695,25 @@ class BaseUI:
         return table
     # fmt: on
 
+    def _update_table(self, data):
+        """Update existing table cells in place
+
+        Re-rendering the whole table on every refresh allocates a new
+        'Table', columns, and rows each time. Since the table structure
+        (columns and number of rows) doesn't change between refreshes,
+        we instead swap in new cell content for each existing row. The
+        Rich 'Live' display then picks up the changes on next redraw.
+
+        Args:
+            data: 'list' of data rows, each with a specific data set render
+        """
+        labelCol, currValCol, sparkCol = self._table.columns
+
+        for indx, row in enumerate(data):
+            labelCol._cells[indx] = row['label']
+            currValCol._cells[indx] = BaseUI._prep_currval_str(row)
+            sparkCol._cells[indx] = BaseUI._prep_sparkline_str(row, False)
+
     def initialize(self, appNameLong, appNameShort, appVer, dataRows, enable=True):
         """Initialize main UI
         
@@ -588,14 +796,32 @@ class BaseUI:
         if logo.rows > 1:
             self._layout['logo'].update(logo)
 
-        self._layout['actHdr'].update(Rule(title=self.statusHdr, style=COLOR_DEF, end=''))
-        self._layout['actNextUpld'].update(Text(f'{self.statusLblNext}--:--:--'))
-        self._layout['actLastUpld'].update(Text(f'{self.statusLblLast}--:--:--'))
-        self._layout['actNumUpld'].update(Text(f'{self.statusLblTotUpld}-'))
-        self._layout['actCurrent'].update(BaseUI._make_statusbar(self._console))
+        # Bind 'action' section cells once so that the 'update_*' methods
+        # below can use plain tuple indexing instead of going through
+        # 'Layout.__getitem__' on every status refresh.
+        self._statusCells = (
+            self._layout['actNextUpld'],
+            self._layout['actLastUpld'],
+            self._layout['actNumUpld'],
+            self._layout['actCurrent'],
+        )
 
-        # Display main row with data table
-        self._layout['main'].update(BaseUI._render_table(dataRows, True))
+        self._layout['actHdr'].update(Rule(title=self.statusHdr, style=COLOR_DEF, end=''))
+        # Persistent status line 'Text' objects. The 'update_upload_*'
+        # methods mutate these in place on every status tick instead of
+        # allocating new 'Text' objects for each update.
+        self._nextUpldText = Text(f'{self.statusLblNext}--:--:--')
+        self._lastUpldText = Text(f'{self.statusLblLast}--:--:--')
+        self._numUpldText = Text(f'{self.statusLblTotUpld}-')
+        self._statusCells[0].update(self._nextUpldText)
+        self._statusCells[1].update(self._lastUpldText)
+        self._statusCells[2].update(self._numUpldText)
+        self._statusCells[3].update(BaseUI._make_statusbar(self._console))
+
+        # Display main row with data table. We keep a reference to the
+        # table so that we can update its cells in place on each refresh.
+        self._table = BaseUI._render_table(dataRows, True)
+        self._layout['main'].update(self._table)
 
         # Display footer row
         self._layout['footer'].update(BaseUI._make_footer(logo.plain, conWidth))
@@ -606,43 +832,75 @@ class BaseUI:
         self._active = True
         self.logo = logo
 
+    @staticmethod
+    def _data_signature(data):
+        """Compute cheap signature of display-relevant values
+
+        Sensor data often doesn't change between refreshes, and we
+        use this signature to skip the whole table update when the
+        displayed values would come out identical to the last frame.
+
+        NOTE: the signature covers the entire spark window ... the
+              sparkline shifts left even when the newest sample and
+              min/max stay the same (e.g. an outlier scrolling out),
+              so length + last sample alone would miss redraws.
+              Hashing the raw bytes is still far cheaper than a
+              re-render.
+        """
+        return tuple(
+            (
+                row['dataPt'],
+                row['dataPtDelta'],
+                row['sparkMinMax'],
+                np.asarray(row['sparkData']).tobytes(),
+            )
+            for row in data
+        )
+
     def update_data(self, data):
         """Update table with data"""
         if self._active:
-            self._layout['main'].update(BaseUI._render_table(data))
+            # Skip update entirely if nothing changed since last frame
+            sig = BaseUI._data_signature(data)
+            if sig == self._lastDataSig:
+                return
+            self._lastDataSig = sig
+
+            if self._table is not None and data and len(self._table.rows) == len(data):
+                self._update_table(data)
+            else:
+                # Row structure changed (or no data) -- rebuild from scratch
+                self._table = BaseUI._render_table(data)
+                self._layout['main'].update(self._table)
 
     def update_upload_num(self, num, maxNum=0):
         """Update 'upload' number(s)"""
         if self._active:
             maxNumStr = f"/{maxNum}" if maxNum > 0 else ''
-            self._layout['actNumUpld'].update(Text(
-                f"{self.statusLblTotUpld}{num}{maxNumStr}",
-                style=COLOR_DEF
-            ))
+            self._numUpldText.plain = f"{self.statusLblTotUpld}{num}{maxNumStr}"
+            self._numUpldText.style = COLOR_DEF
 
     def update_upload_next(self, nextTime):
         """Update time for next upload"""
         if self._active:
-            self._layout['actNextUpld'].update(Text(
-                f"{self.statusLblNext}{self._make_time_str(nextTime)}",
-                style=COLOR_DEF
-            ))
+            self._nextUpldText.plain = f"{self.statusLblNext}{self._make_time_str(nextTime)}"
+            self._nextUpldText.style = COLOR_DEF
 
     def update_upload_last(self, lastTime, lastStatus=HTTP_STATUS_OK):
         """Update time for last upload"""
         if self._active:
-            text = Text()
-            text.append(
-                f"{self.statusLblLast}{self._make_time_str(lastTime)} ",
-                style=COLOR_DEF
-            )
-
+            prefix = f"{self.statusLblLast}{self._make_time_str(lastTime)} "
             if lastStatus == HTTP_STATUS_OK:
-                text.append('[OK]', style=COLOR_OK)
+                tag, tagColor = '[OK]', COLOR_OK
             else:
-                text.append('[Error]', style=COLOR_ERROR)
+                tag, tagColor = '[Error]', COLOR_ERROR
 
-            self._layout['actLastUpld'].update(text)
+            text = self._lastUpldText
+            text.plain = f'{prefix}{tag}'
+            text.spans[:] = [
+                Span(0, len(prefix), COLOR_DEF),
+                Span(len(prefix), len(prefix) + len(tag), tagColor),
+            ]
 
     def update_upload_status(self, lastTime, lastStatus, nextTime, numUploads, maxUploads=0):
         """Update all 'status' values"""
@@ -655,7 +913,7 @@ class BaseUI:
         """Update current 'action' status"""
         if self._active:
             msgStr = STATUS_LBL_WAIT if actMsg is None else actMsg
-            self._layout['actCurrent'].update(self._make_statusbar(self._console, msgStr))
+            self._statusCells[3].update(self._make_statusbar(self._console, msgStr))
 
     def update_progress(self, progUpdate=None, progMsg=None):
         """Update progress basr"""
@@ -664,7 +922,7 @@ class BaseUI:
                 msgStr = STATUS_LBL_WAIT if progMsg is None else progMsg
                 self._progBar = self._make_progressbar(self._console)
                 self._progTaskID = self._progBar.add_task(description=msgStr, total=MAX_PROGBAR)
-                self._layout['actCurrent'].update(self._progBar)
+                self._statusCells[3].update(self._progBar)
             else:
                 self._progBar.update(self._progTaskID, completed=progUpdate) # type: ignore
                 # assert False
@@ -12,7 +12,6 @@ TODO:
 Dependencies:
  - random
  - oauthlib
- - tomllib / tomli
  - arduino-iot-client
  - requests-authlib
  - adafruit-io
@@ -25,18 +24,37 @@ import time
 import sys
 import asyncio
 from abc import ABC, abstractmethod
+from collections import ChainMap
 from pathlib import Path
 from random import randint
 
+# Use the (much faster) C-based 'orjson' serializer when available.
+# It's optional -- install with the 'fast' extra -- and we fall back
+# to the stdlib 'json' module otherwise.
 try:
-    import tomllib
-except ModuleNotFoundError:
-    import tomli as tomllib
+    import orjson
 
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+
+    def _json_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+    def _json_pretty(obj):
+        return json.dumps(obj, indent=4, sort_keys=True)
+
+import requests
 from oauthlib.oauth2 import BackendApplicationClient
+from requests.adapters import HTTPAdapter
 from requests_oauthlib import OAuth2Session
 
-from Adafruit_IO import Client as aioREST, MQTTClient as aioMQTT, Feed as aioFeed
+from Adafruit_IO import Client as aioREST, MQTTClient as aioMQTT, Feed as aioFeed, Data as aioData
 # from Adafruit_IO import RequestError, ThrottlingError
 
 import iot_api_client as ardClient
@@ -48,8 +66,10 @@ __all__ = [
     'AdafruitFeed',
     'AdafruitCloudError',
     'ArduinoCloudError',
+    'enable_fast_loop',
     'KWD_AIO_ID',
     'KWD_AIO_KEY',
+    'KWD_AIO_BATCH',
     'KWD_ARD_ID',
     'KWD_ARD_KEY',
     'KWD_AIO_LOC_ID',
@@ -63,6 +83,7 @@ __all__ = [
 # =========================================================
 KWD_AIO_ID = 'AIO_ID'
 KWD_AIO_KEY = 'AIO_KEY'
+KWD_AIO_BATCH = 'AIO_BATCH'
 KWD_AIO_LOC_ID = 'AIO_LOC_ID'
 KWD_AIO_RWRD_ID = 'AIO_RWRD_ID'
 KWD_AIO_RNUM_ID = 'AIO_RNUM_ID'
@@ -71,9 +92,105 @@ KWD_ARD_ID = 'ARD_ID'
 KWD_ARD_KEY = 'ARD_KEY'
 
 
+# =========================================================
+#              M I S C .   C O N S T A N T S
+# =========================================================
+ARD_API_URL = 'https://api2.arduino.cc/iot'
+ARD_TOKEN_URL = 'https://api2.arduino.cc/iot/v1/clients/token'
+ARD_TOKEN_MARGIN = 60  # Refresh OAuth token this many seconds before expiry
+
+AIO_FEED_CACHE_TTL = 60  # Cache Adafruit IO feed metadata this many seconds
+
+
 # =========================================================
 #                        H E L P E R S
 # =========================================================
+def _to_plain(obj):
+    """Convert namedtuple-based structures to plain JSON-safe types
+
+    This walks the structure once, converting namedtuples to dicts
+    as it goes. It replaces the old 'json.loads(json.dumps(...))'
+    round-trip, which encoded and then re-parsed every value just
+    to strip the namedtuple types.
+    """
+    if hasattr(obj, '_asdict'):
+        return {key: _to_plain(val) for key, val in obj._asdict().items()}
+    if isinstance(obj, dict):
+        return {key: _to_plain(val) for key, val in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_plain(item) for item in obj]
+
+    return obj
+
+
+def enable_fast_loop():
+    """Install the 'uvloop' event loop policy, if available
+
+    The libuv-based 'uvloop' event loop is noticeably faster than the
+    stdlib asyncio loop when sending data to several cloud services
+    concurrently (e.g. via 'asyncio.gather'). It's optional -- install
+    with the 'fast' extra -- and this is a no-op when not available.
+
+    Returns:
+        'True' if 'uvloop' was installed, else 'False'
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    uvloop.install()
+    return True
+
+
+class _PooledAdafruitREST(aioREST):
+    """Adafruit IO REST client with persistent connection pooling.
+
+    The stock Adafruit_IO client uses module-level 'requests' calls,
+    which open a fresh TCP+TLS connection for every request. In our
+    upload loops the TLS handshake dominates wall time, so we route
+    all requests through a shared 'requests.Session' with a mounted
+    keep-alive pool instead. The handshake is then paid once and
+    amortized over all subsequent calls.
+    """
+
+    def __init__(self, username, key, proxies=None, base_url='https://io.adafruit.com'):
+        super().__init__(username, key, proxies, base_url)
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+    def _get(self, path, params=None):
+        response = self._session.get(
+            self._compose_url(path),
+            headers=self._headers({'X-AIO-Key': self.key}),
+            proxies=self.proxies,
+            params=params,
+        )
+        self._last_response = response
+        self._handle_error(response)
+        return response.json()
+
+    def _post(self, path, data):
+        response = self._session.post(
+            self._compose_url(path),
+            headers=self._headers({'X-AIO-Key': self.key, 'Content-Type': 'application/json'}),
+            proxies=self.proxies,
+            data=_json_dumps(data),
+        )
+        self._last_response = response
+        self._handle_error(response)
+        return response.json()
+
+    def _delete(self, path):
+        response = self._session.delete(
+            self._compose_url(path),
+            headers=self._headers({'X-AIO-Key': self.key, 'Content-Type': 'application/json'}),
+            proxies=self.proxies,
+        )
+        self._last_response = response
+        self._handle_error(response)
+
+
 class AdafruitCloudError(Exception):
     """Custom exception class for Adafruit IO errors"""
 
@@ -94,8 +211,14 @@ class CloudService(ABC):
     This class is the base for all cloud service classes. It holds
     some common methods and properties to ensure a basic level of
     compatibility between the service objects.
+
+    NOTE: service objects sit in hot publish loops, so we use
+    '__slots__' (here and in subclasses) to keep attribute access
+    an offset load instead of a per-instance dict probe.
     """
 
+    __slots__ = ('_ID', '_KEY', '_REST', '_MQTT', '_active')
+
     def __init__(self, srvID, srvKey, rest=None, mqtt=None, active=False):
         self._ID = srvID
         self._KEY = srvKey
@@ -178,6 +301,15 @@ class AdafruitCloud(CloudService):
         aio_receive_data:   Receive data from an existing Adafruit IO feed
     """
 
+    # fmt: off
+    __slots__ = (
+        '_aioLocID', '_aioRndWrdID', '_aioRndNumID',
+        '_batchSize', '_sendBuf',
+        '_feedTTL', '_feedListCache', '_feedCache',
+        '_mqttConnected',
+    )
+    # fmt: on
+
     def __init__(self, *args, **kwargs):
         """Initialize cloud service
 
@@ -190,8 +322,12 @@ class AdafruitCloud(CloudService):
 
         # We combine 'args' and 'kwargs' to allow users to provide the entire
         # 'config' object and/or individual settings (which could override
-        # values in 'config').
-        settings = {**args[0], **kwargs} if args and isinstance(args[0], dict) else kwargs
+        # values in 'config'). 'ChainMap' gives kwargs precedence without
+        # copying/rehashing the (potentially large) 'config' dict.
+        if args and isinstance(args[0], dict):
+            settings = ChainMap(kwargs, args[0]) if kwargs else args[0]
+        else:
+            settings = kwargs
 
         active = False
         rest = None
@@ -201,7 +337,7 @@ class AdafruitCloud(CloudService):
         aioKey = settings.get(KWD_AIO_KEY)
 
         if aioID and aioKey:
-            rest = aioREST(aioID, aioKey)
+            rest = _PooledAdafruitREST(aioID, aioKey)
             mqtt = aioMQTT(aioID, aioKey)
             active = bool(rest) and bool(mqtt)
         super().__init__(aioID, aioKey, rest, mqtt, active)
@@ -210,6 +346,35 @@ class AdafruitCloud(CloudService):
         self._aioRndWrdID = settings.get(KWD_AIO_RWRD_ID)
         self._aioRndNumID = settings.get(KWD_AIO_RNUM_ID)
 
+        # Optional upload batching. With 'AIO_BATCH' > 1, 'send_data'
+        # coalesces values per feed and uploads them in one batch
+        # request once the buffer is full (or 'flush()' is called).
+        self._batchSize = int(settings.get(KWD_AIO_BATCH, 1) or 1)
+        self._sendBuf = {}
+
+        # Feed metadata rarely changes, so we cache 'feed_list' and
+        # 'feed_info' responses for a short while. This turns repeated
+        # metadata lookups into plain dict reads instead of HTTP calls.
+        # Caches are invalidated by 'create_feed' and 'delete_feed'.
+        self._feedTTL = AIO_FEED_CACHE_TTL
+        self._feedListCache = None
+        self._feedCache = {}
+
+        # MQTT connection is established lazily on first MQTT publish
+        self._mqttConnected = False
+
+    def _ensure_mqtt(self):
+        """Connect MQTT client on first use
+
+        We keep one long-lived MQTT connection (with a background
+        network loop) instead of connecting per publish, so only the
+        first MQTT publish pays the connection handshake.
+        """
+        if not self._mqttConnected:
+            self._MQTT.connect()
+            self._MQTT.loop_background()
+            self._mqttConnected = True
+
     @property
     def aioRandWord(self):
         return self._aioRndWrdID
@@ -248,11 +413,15 @@ class AdafruitCloud(CloudService):
         feed = aioFeed(name=feedName)
 
         if strict:
-            feedList = self._REST.feeds()
-            nameList = [feed.name for feed in feedList]
-            if feedName in nameList:
+            # NOTE: do not reuse 'feed' as loop variable here! That
+            #       would clobber the new feed object created above.
+            nameSet = {f.name for f in self.feed_list()}
+            if feedName in nameSet:
                 raise AdafruitCloudError(f"Adafruit IO already has a feed named '{feedName}'")
 
+        # New feed invalidates any cached feed metadata
+        self._feedListCache = None
+
         return self._REST.create_feed(feed)
 
     def feed_list(self):
@@ -272,7 +441,14 @@ class AdafruitCloud(CloudService):
         if not self._active:
             raise AdafruitCloudError()
 
-        return self._REST.feeds()
+        now = time.monotonic()
+        if self._feedListCache is not None and now - self._feedListCache[0] < self._feedTTL:
+            return self._feedListCache[1]
+
+        feedList = self._REST.feeds()
+        self._feedListCache = (now, feedList)
+
+        return feedList
 
     def feed_info(self, feedKey):
         """Get Adafruit IO feed info
@@ -297,7 +473,53 @@ class AdafruitCloud(CloudService):
         if not feedKey:
             raise AdafruitCloudError("Invalid 'feedKey' for Adafruit IO client")
 
-        return self._REST.feeds(feedKey)
+        now = time.monotonic()
+        cached = self._feedCache.get(feedKey)
+        if cached is not None and now - cached[0] < self._feedTTL:
+            return cached[1]
+
+        feedInfo = self._REST.feeds(feedKey)
+        self._feedCache[feedKey] = (now, feedInfo)
+
+        return feedInfo
+
+    def prefetch_feeds(self, groupKey):
+        """Prefetch metadata for all feeds in an Adafruit IO group
+
+        Apps that resolve several feed keys at startup would otherwise
+        issue one 'feed_info' request per feed. A single group request
+        returns metadata for all child feeds, which we use to warm the
+        feed cache in one round-trip.
+
+        Args:
+            groupKey:
+                'str' with Adafruit IO group key
+
+        Returns:
+            'list' of feeds in the group
+
+        Raises:
+            CloudError:
+                When Adafruit IO client is not initiated
+            RequestError:
+                When API request fails
+            ThrottlingError:
+                When exceeding Adafruit IO rate limit
+        """
+        if not self._active:
+            raise AdafruitCloudError()
+
+        if not groupKey:
+            raise AdafruitCloudError("Invalid 'groupKey' for Adafruit IO client")
+
+        now = time.monotonic()
+        feeds = self._REST.groups(groupKey).feeds or []
+        for feedInfo in feeds:
+            feedKey = feedInfo.get('key') if isinstance(feedInfo, dict) else feedInfo.key
+            if feedKey:
+                self._feedCache[feedKey] = (now, feedInfo)
+
+        return feeds
 
     def delete_feed(self, feedKey):
         """Delete Adafruit IO feed
@@ -319,9 +541,13 @@ class AdafruitCloud(CloudService):
         if not self._active:
             raise AdafruitCloudError()
 
+        # Deleted feed invalidates any cached feed metadata
+        self._feedListCache = None
+        self._feedCache.pop(feedKey, None)
+
         self._REST.delete_feed(feedKey)
 
-    async def send_data(self, feedKey, dataPt):
+    async def send_data(self, feedKey, dataPt, transport='rest'):
         """Send data value to Adafruit IO feed
 
         Args:
@@ -329,6 +555,11 @@ class AdafruitCloud(CloudService):
                 'str' with Adafruit IO feed key
             dataPt:
                 'str'|'int'|'float' data point
+            transport:
+                'str' with either 'rest' (default) or 'mqtt'. For
+                high-rate publishing, 'mqtt' sends a single PUBLISH
+                packet over one long-lived connection instead of one
+                HTTPS POST per value.
         Returns:
             Adafruit feed info
 
@@ -343,7 +574,99 @@ class AdafruitCloud(CloudService):
         if not self._active:
             raise AdafruitCloudError()
 
-        self._REST.send_data(feedKey, dataPt)
+        if transport == 'mqtt':
+            await self.send_data_mqtt(feedKey, dataPt)
+            return
+
+        # With batching enabled we only buffer the value here. The
+        # actual upload happens when the buffer is full, collapsing
+        # N requests (and TLS round-trips) into 1 batch request.
+        if self._batchSize > 1:
+            buf = self._sendBuf.setdefault(feedKey, [])
+            buf.append(aioData(value=dataPt, created_epoch=int(time.time())))
+            if len(buf) >= self._batchSize:
+                await self.flush(feedKey)
+        else:
+            await asyncio.to_thread(self._REST.send_data, feedKey, dataPt)
+
+    async def send_data_mqtt(self, feedKey, dataPt):
+        """Send data value to Adafruit IO feed via MQTT
+
+        This publishes over the long-lived MQTT connection that is
+        established on first use, avoiding the TLS handshake and HTTP
+        framing overhead of one HTTPS POST per value.
+
+        Args:
+            feedKey:
+                'str' with Adafruit IO feed key
+            dataPt:
+                'str'|'int'|'float' data point
+
+        Raises:
+            CloudError:
+                When Adafruit IO client is not initiated
+        """
+        if not self._active:
+            raise AdafruitCloudError()
+
+        self._ensure_mqtt()
+        self._MQTT.publish(feedKey, dataPt)
+
+    async def send_data_batch(self, feedKey, dataPts):
+        """Send batch of data values to Adafruit IO feed
+
+        This uses Adafruit IO's batch endpoint to upload any number
+        of values in a single request instead of one request per
+        data point.
+
+        Args:
+            feedKey:
+                'str' with Adafruit IO feed key
+            dataPts:
+                'list' of 'str'|'int'|'float' data points
+
+        Raises:
+            CloudError:
+                When Adafruit IO client is not initiated
+            RequestError:
+                When API request fails
+            ThrottlingError:
+                When exceeding Adafruit IO rate limit
+        """
+        if not self._active:
+            raise AdafruitCloudError()
+
+        if dataPts:
+            await asyncio.to_thread(
+                self._REST.send_batch_data,
+                feedKey,
+                [pt if isinstance(pt, aioData) else aioData(value=pt) for pt in dataPts],
+            )
+
+    async def flush(self, feedKey=None):
+        """Flush any buffered data values to Adafruit IO
+
+        Args:
+            feedKey:
+                'str' with Adafruit IO feed key. If 'None', then
+                buffers for all feeds are flushed.
+
+        Raises:
+            CloudError:
+                When Adafruit IO client is not initiated
+            RequestError:
+                When API request fails
+            ThrottlingError:
+                When exceeding Adafruit IO rate limit
+        """
+        if not self._active:
+            raise AdafruitCloudError()
+
+        feedKeys = [feedKey] if feedKey is not None else list(self._sendBuf)
+        for key in feedKeys:
+            buf = self._sendBuf.pop(key, None)
+            if buf:
+                await asyncio.to_thread(self._REST.send_batch_data, key, buf)
 
     async def receive_data(self, feedKey, raw=False):
         """Receive last data value from Adafruit IO feed
@@ -368,9 +691,38 @@ class AdafruitCloud(CloudService):
         if not self._active:
             raise AdafruitCloudError()
 
-        data = self._REST.receive(feedKey)
+        data = await asyncio.to_thread(self._REST.receive, feedKey)
         return data if raw else data.value
 
+    async def receive_many(self, feedKeys, raw=False):
+        """Receive last data values from several Adafruit IO feeds
+
+        All fetches run concurrently via 'asyncio.gather', so the
+        total latency is roughly that of the slowest request instead
+        of the sum of all round-trips.
+
+        Args:
+            feedKeys:
+                'list' of 'str' with Adafruit IO feed keys
+            raw:
+                If 'True' then raw data objects (in form
+                of 'namedtuple') are returned
+        Returns:
+            'list' with one result per feed key, in the same order
+
+        Raises:
+            CloudError:
+                When Adafruit IO client is not initiated
+            RequestError:
+                When API request fails
+            ThrottlingError:
+                When exceeding Adafruit IO rate limit
+        """
+        if not self._active:
+            raise AdafruitCloudError()
+
+        return await asyncio.gather(*[self.receive_data(key, raw) for key in feedKeys])
+
     async def receive_weather(self, weatherID=None, raw=False):
         """Receive weather data from Adafruit IO feed
 
@@ -396,8 +748,8 @@ class AdafruitCloud(CloudService):
             raise AdafruitCloudError()
 
         wID = weatherID if weatherID is not None else self._aioLocID
-        data = self._REST.receive_weather(wID)
-        return data if raw else json.loads(json.dumps(data))
+        data = await asyncio.to_thread(self._REST.receive_weather, wID)
+        return data if raw else _to_plain(data)
 
     async def receive_random(self, randomID=None, raw=False):
         """Receive random value from Adafruit IO feed
@@ -423,7 +775,7 @@ class AdafruitCloud(CloudService):
         if not self._active:
             raise AdafruitCloudError()
 
-        data = self._REST.receive_random(randomID)
+        data = await asyncio.to_thread(self._REST.receive_random, randomID)
         return data if raw else data.value
 
     # async def aio_receive_random_word(self):
@@ -489,6 +841,8 @@ class ArduinoCloud(CloudService):
         ???
     """
 
+    __slots__ = ('_token', '_tokenExpiry')
+
     def __init__(self, *args, **kwargs):
         """Initialize Cloud
 
@@ -501,31 +855,81 @@ class ArduinoCloud(CloudService):
 
         # We combine 'args' and 'kwargs' to allow users to provide the entire
         # 'config' object and/or individual settings (which could override
-        # values in 'config').
-        settings = {**args[0], **kwargs} if args and isinstance(args[0], dict) else kwargs
+        # values in 'config'). 'ChainMap' gives kwargs precedence without
+        # copying/rehashing the (potentially large) 'config' dict.
+        if args and isinstance(args[0], dict):
+            settings = ChainMap(kwargs, args[0]) if kwargs else args[0]
+        else:
+            settings = kwargs
 
         active = False
-        ard = None
+        oauth = None
 
         ardID = settings.get(KWD_ARD_ID)
         ardKey = settings.get(KWD_ARD_KEY)
 
         if ardID and ardKey:
-            ard = None  # TO DO: fix this placeholder
-            active = bool(ard)
+            # Create a single long-lived session so that repeated API
+            # calls reuse the same TLS connection (keep-alive pool)
+            # instead of paying for a new handshake on every request.
+            oauth = OAuth2Session(client=BackendApplicationClient(client_id=ardID))
+            oauth.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+            active = bool(oauth)
+
+        super().__init__(ardID, ardKey, oauth, None, active)
+
+        self._token = None
+        self._tokenExpiry = 0
+
+    def _ensure_token(self):
+        """Fetch OAuth token, reusing cached token until (nearly) expired
+
+        The Arduino Cloud API uses short-lived OAuth tokens. Fetching
+        a new token on every call adds a full round-trip, so we cache
+        the token and only refresh it shortly before it expires.
+
+        Returns:
+            'dict' with current OAuth token
+
+        Raises:
+            ArduinoCloudError:
+                When Arduino Cloud client is not initiated
+        """
+        if not self._active:
+            raise ArduinoCloudError()
 
-        super().__init__(ardID, ardKey, ard, None, active)
+        if self._token is None or time.monotonic() > self._tokenExpiry - ARD_TOKEN_MARGIN:
+            self._token = self._REST.fetch_token(
+                ARD_TOKEN_URL,
+                client_id=self._ID,
+                client_secret=self._KEY,
+                include_client_id=True,
+                audience=ARD_API_URL,
+            )
+            self._tokenExpiry = time.monotonic() + self._token.get('expires_in', 300)
+
+        return self._token
+
+    async def send_data(self, *args, **kwargs):
+        raise ArduinoCloudError('Arduino Cloud support is not yet implemented')
+
+    async def receive_data(self, *args, **kwargs):
+        raise ArduinoCloudError('Arduino Cloud support is not yet implemented')
 
 
 # =========================================================
 #                    M O D U L E   D E M O
 # =========================================================
 if __name__ == '__main__':
-    # Initialize TOML parser and try to load 'settings.toml' file
-    try:
-        with open(Path(__file__).parent.joinpath('settings.toml'), mode='rb') as fp:
-            config = tomllib.load(fp)
-    except (FileNotFoundError, tomllib.TOMLDecodeError):
+    import f451_common.common as f451Common
+
+    # Try to load 'settings.toml' file. We go through 'load_settings'
+    # so repeated demo runs reuse its pre-parsed settings cache
+    # instead of re-parsing the TOML file every time.
+    settingsPath = Path(__file__).parent.joinpath('settings.toml')
+    if settingsPath.exists():
+        config = f451Common.load_settings(settingsPath)
+    else:
         # fmt: off
         config = {
             'AIO_ID': None,         # Set your 'ADAFRUIT IO USERNAME'
@@ -538,6 +942,11 @@ if __name__ == '__main__':
     if not config.get('AIO_ID') or not config.get('AIO_KEY'):
         sys.exit('ERROR: Missing Adafruit IO credentials')
 
+    # Opt in to the faster 'uvloop' event loop for the demo uploads.
+    # This is deliberately NOT done at import time -- swapping the
+    # process-wide loop policy is the app's call, not the library's.
+    enable_fast_loop()
+
     AIO = AdafruitCloud(config)
     feedName = f'TEST_FEED_{str(time.time_ns())}'
 
@@ -556,14 +965,14 @@ if __name__ == '__main__':
     # use the '_asdict()' method to convert it to regular 'dict'.
     # We then pass the 'dict' to 'json.dumps()' to prettify before
     # we print out the whole structure.
-    pretty = json.dumps(data._asdict(), indent=4, sort_keys=True)
+    pretty = _json_pretty(data._asdict())
     print(pretty)
 
     # Get weather forecast from Adafruit IO as JSON
     print('\n--------------------------------------------')
     print('Receiving latest weather data from Adafruit IO')
     forecast = asyncio.run(AIO.receive_weather())
-    print(json.dumps(forecast, indent=4, sort_keys=True))
+    print(_json_pretty(forecast))
 
     # Parse the current forecast
     # current = forecast['current']
@@ -586,13 +995,13 @@ if __name__ == '__main__':
     # print(f"Receiving random word from Adafruit IO: {someWord}")
     print('Receiving random word from Adafruit IO')
     someWord = asyncio.run(AIO.receive_random(AIO.aioRandWord, True))
-    print(json.dumps(someWord, indent=4, sort_keys=True))
+    print(_json_pretty(someWord))
 
     print('\n--------------------------------------------')
     # someNumber = asyncio.run(iot.aio_receive_random_number())
     # print(f"Receiving random number from Adafruit IO: {someNumber}")
     print('Receiving random number from Adafruit IO')
     someNumber = asyncio.run(AIO.receive_random(AIO.aioRandNumber, True))
-    print(json.dumps(someNumber, indent=4, sort_keys=True))
+    print(_json_pretty(someNumber))
 
     print('=============== [End of Demo] =================\n')
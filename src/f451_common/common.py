@@ -7,40 +7,57 @@ TODO:
  - add more/better tests
 """
 
+import os
 import sys
+import time
 import argparse
+import functools
+import pickle
 import random
 
+from copy import deepcopy
+
 from abc import ABC, abstractmethod
 from datetime import datetime
-from collections import namedtuple
-from subprocess import check_output, STDOUT, DEVNULL
-from pyfiglet import Figlet
+from collections import deque, namedtuple
+
+import numpy as np
+
 from pathlib import Path
 
 from .colors import COLORS as RGBColors
 
-try:
-    import tomllib
-except ModuleNotFoundError:
-    import tomli as tomllib
+from ._toml import tomllib
 
 __all__ = [  # noqa: F822
     'init_cli_parser',
     'is_valid',
+    'is_valid_fast',
+    'is_valid_array',
     'is_in_range',
     'get_delta_range',
+    'get_delta_range_fast',
+    'get_delta_range_batch',
     'load_settings',
     'get_tri_colors',
     'get_RPI_serial_num',
     'get_RPI_ID',
     'check_wifi',
+    'make_history',
+    'temp_compensate',
     'num_to_range',
+    'make_num_to_range',
+    'make_rgb_mapper',
+    'num_to_range_batch',
     'convert_to_rgb',
+    'convert_to_rgb_batch',
+    'build_rgb_lut',
+    'convert_to_rgb_lut',
     'convert_to_bool',
     'make_logo',
     'Runtime',
     'FakeSensor',
+    'DataUnit',
     'COLOR_MAP',
     'COLOR_LOW',
     'COLOR_NORM',
@@ -77,6 +94,8 @@ DEF_ID_PREFIX = 'raspi-'  # Default prefix for ID string
 DEF_TEMP_COMP_FACTOR = 2.25
 MAX_LEN_CPU_TEMPS = 5  # Max number of CPU temps
 
+_EPSILON = sys.float_info.epsilon  # Smallest possible difference
+
 STATUS_YES = 'yes'
 STATUS_ON = 'on'
 STATUS_TRUE = 'true'
@@ -87,6 +106,10 @@ STATUS_FALSE = 'false'
 
 STATUS_UNKNOWN = 'unknown'
 
+# Truthy strings for 'convert_to_bool'. A 'frozenset' gives us a single
+# hashed lookup instead of building a list and scanning it per call.
+_TRUE_STRS = frozenset((STATUS_ON, STATUS_TRUE, STATUS_YES))
+
 # =========================================================
 #            C O L O R   M A P   C O N S T A N T S
 # =========================================================
@@ -103,19 +126,28 @@ STATUS_UNKNOWN = 'unknown'
 #        D >= val >  C -> High              = "cyan"
 #             val >  D -> Dangerously High  = "blue"
 #
-COLOR_MAP = [
+COLOR_MAP = (
     'red',              # 0  -- These colors must also work
     'yellow',           # 1     with 'termcolor' library
     'green',            # 2
     'cyan',             # 3
     'blue',             # 4
-]
+)
 # Shortcuts for indicating main colors
 COLOR_LOW = 0
 COLOR_NORM = 2
 COLOR_HIGH = 4
 # fmt: on
 
+# Output type for 'get_tri_colors'. Defined once at module scope since
+# 'namedtuple' is a (relatively expensive) code-generating factory that
+# shouldn't run on every cache miss.
+TriColor = namedtuple('TriColor', 'low normal high')
+
+# Default color map pre-resolved to RGB values so the 'asRGB' path
+# skips the per-color dict lookups for the common case.
+_COLOR_MAP_RGB = tuple(RGBColors[color] for color in COLOR_MAP)
+
 
 # =========================================================
 #    K E Y W O R D S   F O R   C O N F I G   F I L E S
@@ -128,6 +160,22 @@ KWD_MAX_LEN_CPU_TEMPS = 'CPU_TEMPS'
 #                 H E L P E R   C L A S S
 # =========================================================
 class Runtime(ABC):
+    # Declare slots so instances skip the per-object '__dict__' and
+    # attribute reads become fixed-offset fetches. Subclasses that add
+    # their own attributes still work (they simply get a '__dict__').
+    # fmt: off
+    __slots__ = (
+        'appName', 'appVersion', 'appNameShort', 'appLog', 'appSettings',
+        'appHost', 'appDir',
+        'ioFreq', 'ioDelay', 'ioWait', 'ioThrottle', 'ioRounding', 'ioUploadAndExit',
+        'workStart', 'timeSinceUpdate', 'timeUpdate', 'displayUpdate',
+        'uploadDelay', 'maxUploads', 'numUploads',
+        'config', 'logger', 'console',
+        'feeds', 'sensors',
+        'logLvl', 'debugMode',
+    )
+    # fmt: on
+
     def __init__(
         self,
         appName,
@@ -191,6 +239,26 @@ class Runtime(ABC):
         pass
 
 
+# Output type for 'FakeSensor.get_demo_data'. Defined once at module
+# scope since 'namedtuple' is a (relatively expensive) code-generating
+# factory that shouldn't run on every call.
+DataUnit = namedtuple('DataUnit', 'rndnum rndpcnt')
+
+# Dispatch table for 'FakeSensor.get_demo_data' output formats. One
+# dict lookup replaces a chain of string compares on the hot path.
+# fmt: off
+_FAKE_SENSOR_FMT = {
+    'asList': lambda num, pcnt: [num, pcnt],
+    'asDict': lambda num, pcnt: {'rndnum': num, 'rndpcnt': pcnt},
+    'asTuple': lambda num, pcnt: (num, pcnt),
+    'asNamed': DataUnit,
+}
+# fmt: on
+
+# Shared NumPy random generator for batch data generation
+_RNG = np.random.default_rng()
+
+
 class FakeSensor:
     """Fake sensor class
 
@@ -226,15 +294,31 @@ class FakeSensor:
         # Generate second value
         rndPcnt = random.randint(0, 100)
 
-        if outFmt == 'asList':
-            return [rndNum, rndPcnt]
-        elif outFmt == 'asDict':
-            return {'rndnum': rndNum, 'rndpcnt': rndPcnt}
-        elif outFmt == 'asTuple':
-            return (rndNum, rndPcnt)
-        else:
-            DataUnit = namedtuple('DataUnit', 'rndnum rndpcnt')
-            return DataUnit(rndnum=rndNum, rndpcnt=rndPcnt)
+        return _FAKE_SENSOR_FMT.get(outFmt, DataUnit)(rndNum, rndPcnt)
+
+    @staticmethod
+    def get_demo_data_batch(numVals, delta=None):
+        """Generate batch of random data in one vectorized pass
+
+        Generating N samples through 'get_demo_data' costs N Python
+        calls into 'random.randint'. This fills the whole batch with
+        a single C-level call per column instead, which pairs well
+        with batched cloud uploads.
+
+        Args:
+            numVals: 'int' with number of samples to generate
+            delta: 'float' with ±% for range of values
+        Returns:
+            'ndarray' with shape '(numVals, 2)' holding one
+            '(rndnum, rndpcnt)' pair per row
+        """
+        minVal = 1 if delta is None else max(1, int((1 - delta / 100) * 100))
+        maxVal = 200 if delta is None else min(200, int((1 + delta / 100) * 100))
+
+        rndNums = _RNG.integers(minVal, maxVal + 1, size=numVals, dtype=np.int32)
+        rndPcnts = _RNG.integers(0, 101, size=numVals, dtype=np.int32)
+
+        return np.stack((rndNums, rndPcnts), axis=1)
 
 
 # =========================================================
@@ -286,6 +370,29 @@ def init_cli_parser(appName, appVersion, setDefaults=True):
     # fmt: off
 
 
+@functools.lru_cache(maxsize=16)
+def _make_tri_colors(colorMap, asRGB):
+    """Build (cached) TriColor tuple from hashable color map."""
+    if asRGB:
+        if colorMap == COLOR_MAP:
+            return TriColor(
+                _COLOR_MAP_RGB[COLOR_LOW],  # e.g. (255, 0, 0)
+                _COLOR_MAP_RGB[COLOR_NORM],
+                _COLOR_MAP_RGB[COLOR_HIGH],
+            )
+        return TriColor(
+            RGBColors[colorMap[COLOR_LOW]],
+            RGBColors[colorMap[COLOR_NORM]],
+            RGBColors[colorMap[COLOR_HIGH]],
+        )
+    else:
+        return TriColor(
+            colorMap[COLOR_LOW],  # e.g. 'red'
+            colorMap[COLOR_NORM],
+            colorMap[COLOR_HIGH],
+        )
+
+
 def get_tri_colors(colors=None, asRGB=False):
     """Get low-normal-high colors
 
@@ -297,6 +404,10 @@ def get_tri_colors(colors=None, asRGB=False):
           tuples) which are by Sense HAT library (and others)
           to color a graph value, etc.
 
+    NOTE: This is a pure function of its arguments and it's often
+          called once per data row per display refresh. We therefore
+          memoize the result for each color map.
+
     Args:
         colors: optional set of custom colors
         asRGB: returns RGB values instead of color names as strings
@@ -304,22 +415,9 @@ def get_tri_colors(colors=None, asRGB=False):
     Returns:
         TriColor (named tuple) with color names as strings or RGB values (as tuples)
     """
-    TriColor = namedtuple('TriColor', 'low normal high')
-
     colorMap = COLOR_MAP if colors is None else colors
 
-    if asRGB:
-        return TriColor(
-            RGBColors[colorMap[COLOR_LOW]],  # e.g. (255, 0, 0)
-            RGBColors[colorMap[COLOR_NORM]],
-            RGBColors[colorMap[COLOR_HIGH]],
-        )
-    else:
-        return TriColor(
-            colorMap[COLOR_LOW],  # e.g. 'red'
-            colorMap[COLOR_NORM],
-            colorMap[COLOR_HIGH],
-        )
+    return _make_tri_colors(tuple(colorMap), asRGB)
 
 
 def is_valid(val, valid, allowNone=True):
@@ -358,6 +456,35 @@ def is_valid(val, valid, allowNone=True):
     return False
 
 
+def is_valid_array(values, valid, allowNone=True):
+    """Verify a whole sequence of values in one pass
+
+    This is the vectorized version of 'is_valid'. Instead of calling
+    'is_valid' once per element -- which is pure interpreter overhead
+    on a hot display-refresh path -- we check the entire sequence with
+    a single set of NumPy comparisons.
+
+    NOTE: Unlike the scalar 'is_valid', missing values ('None'/'NaN')
+          are always flagged as invalid here, since a mask is used to
+          filter values for display and missing values can't be
+          displayed anyway.
+
+    Args:
+        values: sequence with numeric values (may contain 'None' values)
+        valid: 'tuple' with min/max values for valid range
+        allowNone: if 'True', then skip compare if 'valid' is 'None'
+
+    Returns:
+        NumPy 'bool' array with 'True' for each valid value
+    """
+    arr = np.array(values, dtype=np.float64)
+
+    if valid is None or not all(valid):
+        return ~np.isnan(arr) if allowNone else np.zeros(arr.size, dtype=bool)
+
+    return (arr >= valid[0]) & (arr <= valid[1])
+
+
 def is_in_range(first, second, factor):
     """Check if 1st value is within X% of 2nd value
 
@@ -390,6 +517,12 @@ def get_delta_range(first, second, factor):
     if they're equal-ish, and we can use this to even
     out minor deviations between sensor readings.
 
+    NOTE: for negative reference values (e.g. temperatures below
+          zero) the 'second * (1 ± factor)' band inverts. We now
+          classify against the actual lower/upper bounds, so an
+          equal pair like (-100, -100) returns 0 ('within range')
+          where earlier versions returned 1.
+
     Args:
         first: value to compare
         second: value to compare against
@@ -405,54 +538,217 @@ def get_delta_range(first, second, factor):
     if first is None or second is None:
         return 0
 
-    # fmt: off
+    return get_delta_range_fast(float(first), second, factor)
+
+
+def is_valid_fast(val, lower, upper):
+    """Range check without 'None' handling
+
+    Branch-light variant of 'is_valid' for inner loops where the
+    caller has already filtered out missing values and resolved the
+    bounds (use '-inf'/'inf' for open bounds).
+
+    Args:
+        val: numeric value to check
+        lower: numeric lower bound
+        upper: numeric upper bound
+
+    Returns:
+        'True' if value is within bounds, else 'False'
+    """
+    return lower <= val <= upper
+
+
+def get_delta_range_fast(first, second, factor):
+    """Compare values without 'None' handling
+
+    Branchless variant of 'get_delta_range' for inner loops where
+    the caller has already filtered out missing values. The result
+    is computed as a difference of two comparisons instead of an
+    if/elif tree.
+
+    NOTE: same negative-reference semantics as 'get_delta_range'
+          ... both comparisons are checked, so an inverted band
+          (negative 'second') still classifies correctly.
+
+    Args:
+        first: numeric value to compare
+        second: numeric value to compare against
+        factor: factor to extend range for comparison
+
+    Returns:
+        1: above range
+        0: within range
+        -1: below range
+    """
+    return (first > second * (1 + factor)) - (first < second * (1 - factor))
+
+
+def get_delta_range_batch(values, second, factor):
+    """Compare a whole window of values against a reference in one pass
+
+    Rolling windows (e.g. the CPU temperature history capped at
+    'MAX_LEN_CPU_TEMPS') would otherwise call 'get_delta_range' once
+    per element. This variant classifies the entire window with a
+    single set of NumPy comparisons.
+
+    NOTE: callers that keep their window as a 1-D 'ndarray' (rather
+          than a list of floats) get this conversion for free.
+
+    NOTE: same negative-reference semantics as 'get_delta_range'.
+
+    Args:
+        values: sequence with numeric values
+        second: value to compare against
+        factor: factor to extend range for comparison
+
+    Returns:
+        NumPy 'int8' array with 1 (above), 0 (within), or -1 (below)
+        per value
+    """
+    arr = np.asarray(values, dtype=np.float64)
+
+    # No reference value means 'no change' ... same as scalar version
+    if second is None:
+        return np.zeros(arr.size, dtype=np.int8)
+
     lower = second * (1 - factor)
     upper = second * (1 + factor)
-    if float(first) > upper:    # Above range
-        return 1
-    elif float(first) < lower:  # Below range
-        return -1
-    else:
-        return 0                # Within range
-    # fmt: on
 
+    return ((arr > upper).astype(np.int8) - (arr < lower)).astype(np.int8)
+
+
+# In-process cache for parsed settings files. We key each entry on
+# '(path, mtime, size)' so that any change to the file on disk will
+# automatically invalidate the cached copy.
+_settingsCache = {}
+
+SETTINGS_CACHE_SFX = '.cache'  # Suffix for pre-parsed settings cache files
+SETTINGS_MMAP_MIN = 16 * 1024  # Only mmap settings files larger than this
+
+
+def _read_settings_cache(cacheFile, srcStat):
+    """Read pre-parsed settings from disk cache, if still fresh."""
+    try:
+        if os.stat(cacheFile).st_mtime_ns >= srcStat.st_mtime_ns:
+            with open(cacheFile, mode='rb') as fp:
+                return pickle.load(fp)
+    except (OSError, pickle.PickleError, EOFError):
+        pass
+
+    return None
+
+
+def _write_settings_cache(cacheFile, settings):
+    """Write pre-parsed settings to disk cache ... best effort only."""
+    try:
+        with open(cacheFile, mode='wb') as fp:
+            pickle.dump(settings, fp, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
 
-def load_settings(settingsFile):
+
+def load_settings(settingsFile, useCache=True):
     """Initialize TOML parser and load settings file
 
+    Parsing TOML is relatively expensive and most apps (re-)load
+    the same settings file on every start. We therefore memoize
+    parsed settings in-process -- keyed on path, mtime, and size
+    so that edits invalidate the cache -- and we also keep a
+    pre-parsed ('pickle') copy next to the TOML file, which is
+    much faster to load on subsequent (cold) runs.
+
     Args:
         settingsFile: path object or string with filename
+        useCache: if 'True' then we use in-process and on-disk caches
 
     Returns:
         'dict' with values from TOML file
     """
     try:
-        with open(settingsFile, mode='rb') as fp:
-            settings = tomllib.load(fp)
-
-    except (FileNotFoundError, tomllib.TOMLDecodeError):
+        fileStat = os.stat(settingsFile)
+    except OSError:
         sys.exit(f"Missing or invalid file: '{settingsFile}'")
 
-    else:
-        return settings
+    cacheKey = (str(settingsFile), fileStat.st_mtime_ns, fileStat.st_size)
+    if useCache and cacheKey in _settingsCache:
+        # Return a copy so that callers cannot mutate the cached version
+        return deepcopy(_settingsCache[cacheKey])
+
+    # Check for fresh pre-parsed copy on disk before we parse the TOML
+    cacheFile = f'{settingsFile}{SETTINGS_CACHE_SFX}'
+    settings = _read_settings_cache(cacheFile, fileStat) if useCache else None
+
+    if settings is None:
+        try:
+            with open(settingsFile, mode='rb') as fp:
+                # Large settings files are read via 'mmap' to skip the extra
+                # read-syscall/copy overhead. Small files (i.e. most of them)
+                # fall through to a plain 'tomllib.load' since the mmap setup
+                # cost outweighs any benefit.
+                if fileStat.st_size >= SETTINGS_MMAP_MIN:
+                    import mmap
+
+                    with mmap.mmap(fp.fileno(), fileStat.st_size, access=mmap.ACCESS_READ) as mm:
+                        settings = tomllib.loads(mm[:].decode('utf-8'))
+                else:
+                    settings = tomllib.load(fp)
+
+        except (FileNotFoundError, tomllib.TOMLDecodeError):
+            sys.exit(f"Missing or invalid file: '{settingsFile}'")
+
+        if useCache:
+            _write_settings_cache(cacheFile, settings)
 
+    if useCache:
+        _settingsCache[cacheKey] = deepcopy(settings)
 
+    return settings
+
+
+def _clear_settings_cache():
+    """Drop all in-process cached settings (e.g. for tests)."""
+    _settingsCache.clear()
+
+
+# Mirror the 'functools.lru_cache' interface so callers can reset the
+# settings cache the same way they would for any other cached helper.
+load_settings.cache_clear = _clear_settings_cache
+
+
+@functools.lru_cache(maxsize=1)
 def get_RPI_serial_num():
     """Get Raspberry Pi serial number
 
     Based on code from Enviro+ example 'luftdaten_combined.py'
 
+    NOTE: the serial number can't change while we're running, so
+          we only read '/proc/cpuinfo' once per process. We read
+          the file in one go and scan backwards at byte level --
+          the 'Serial' line sits at the end of the file, so this
+          touches almost none of the preceding per-core blocks.
+
     Returns:
         'str' with RPI serial number or 'None' if we can't find it
     """
     try:
-        with open('/proc/cpuinfo', 'r') as f:
-            for line in f:
-                if line[:6] == 'Serial':
-                    return line.split(':')[1].strip()
+        with open('/proc/cpuinfo', 'rb') as f:
+            buf = f.read()
     except OSError:
         return None
 
+    indx = buf.rfind(b'\nSerial')
+    if indx < 0:
+        return None
+
+    colon = buf.find(b':', indx)
+    if colon < 0:
+        return None
+
+    end = buf.find(b'\n', colon)
+
+    return buf[colon + 1 : end if end >= 0 else len(buf)].strip().decode() or None
+
 
 def get_RPI_ID(prefix='', suffix='', default='n/a'):
     """Get Raspberry Pi ID
@@ -472,23 +768,125 @@ def get_RPI_ID(prefix='', suffix='', default='n/a'):
     return f'{prefix}{serialNum}{suffix}' if serialNum else default
 
 
+WIFI_CHECK_TTL = 5.0  # Cache connectivity check result this many seconds
+
+# TTL cache for 'check_wifi' ... holds '(timestamp, result)'
+_wifiCache = None
+
+
+def _has_default_route():
+    """Check '/proc/net/route' for an active default route
+
+    Returns:
+        'True'/'False' based on routing table, or 'None' if the
+        table could not be read (e.g. not on Linux)
+    """
+    try:
+        with open('/proc/net/route') as f:
+            next(f)  # Skip header row
+            for line in f:
+                fields = line.split()
+                if fields[1] == '00000000' and int(fields[3], 16) & 0x2:
+                    return True
+    except (OSError, StopIteration, IndexError, ValueError):
+        return None
+
+    return False
+
+
 def check_wifi():
     """Check for Wi-Fi connection on Raspberry Pi
 
     Based on code from Enviro+ example 'luftdaten_combined.py'
 
-    TODO: find better way to do this
+    NOTE: polling loops may probe connectivity often, so the result
+          is cached for a few seconds ('WIFI_CHECK_TTL') and the
+          check itself reads the kernel routing table instead of
+          forking a subprocess.
 
     Returns:
         'True' - wi-fi confirmed
         'False' - status unknown
     """
+    global _wifiCache
+
+    now = time.monotonic()
+    if _wifiCache is not None and now - _wifiCache[0] < WIFI_CHECK_TTL:
+        return _wifiCache[1]
+
+    # Fast path: check interface state via 'sysfs' and the routing
+    # table -- both are cheap in-process reads.
+    result = False
     try:
-        result = check_output(['hostname', '-I'], stderr=DEVNULL)
-    except Exception:
-        result = None
+        for iface in Path('/sys/class/net').glob('wl*'):
+            if (iface / 'operstate').read_text().strip() == 'up':
+                result = True
+                break
+    except OSError:
+        pass
+
+    if not result:
+        result = _has_default_route()
+
+    # Fallback: same behavior as before on systems where neither
+    # 'sysfs' nor the routing table could be read
+    if result is None:
+        from subprocess import check_output, DEVNULL
+
+        try:
+            result = check_output(['hostname', '-I'], stderr=DEVNULL) is not None
+        except Exception:
+            result = False
+
+    _wifiCache = (now, result)
+
+    return result
+
+
+def make_history(maxLen, defVal=None):
+    """Create bounded history queue for sensor data
+
+    Data history queues (e.g. 'row["data"]' as used by the CLI UI
+    'prep_data' function) should always be bounded so that the
+    display path never has to trim or copy unbounded lists on every
+    refresh. This helper creates a pre-filled 'deque' with a fixed
+    max length, following the same pattern as the 'SenseData' and
+    'DemoData' classes.
+
+    Args:
+        maxLen: max length of queue
+        defVal: default value used to pre-fill the queue
+
+    Returns:
+        'deque' pre-filled with 'defVal' and capped at 'maxLen'
+    """
+    return deque([defVal] * maxLen, maxlen=maxLen)
+
+
+def temp_compensate(rawTemp, cpuTemps, factor):
+    """Compensate temperature reading for CPU heat bleed
+
+    Sensors mounted close to the CPU (e.g. Sense HAT, Enviro+) read
+    high because of heat bleed from the board. The standard fix is to
+    pull the reading back toward ambient using a rolling average of
+    recent CPU temperatures (see 'MAX_LEN_CPU_TEMPS').
+
+    NOTE: the rolling window is tiny (a handful of samples), so a
+          plain 'sum' over it beats NumPy dispatch overhead -- this
+          is deliberately not vectorized.
 
-    return result is not None
+    Args:
+        rawTemp: raw temperature reading from sensor
+        cpuTemps: sequence with recent CPU temperature samples
+        factor: compensation factor (e.g. 'DEF_TEMP_COMP_FACTOR') ...
+                lower means more correction
+
+    Returns:
+        'float' with compensated temperature
+    """
+    avgCpuTemp = sum(cpuTemps) / len(cpuTemps)
+
+    return rawTemp - ((avgCpuTemp - rawTemp) / factor)
 
 
 def num_to_range(num, inMinMax, outMinMax, force=False):
@@ -529,20 +927,132 @@ def num_to_range(num, inMinMax, outMinMax, force=False):
     if outMinMax[0] > outMinMax[1]:
         raise ValueError(f"Invalid 'outMinMax' values: ({outMinMax[0]},{outMinMax[1]})")
 
-    deltaInMinMax = (inMinMax[1] - inMinMax[0]) if inMinMax[1] != inMinMax[0] else 1
-    deltaOutMinMax = (outMinMax[1] - outMinMax[0]) if outMinMax[1] != outMinMax[0] else 1
+    # Unpack bounds once and fold the two range deltas into a single
+    # scale factor so the mapping below is one multiply. The explicit
+    # 'float(...)' casts this used to carry were no-ops -- true
+    # division always yields a float.
+    #
+    # NOTE: 'make_num_to_range' and 'num_to_range_batch' use the same
+    #       scale-factor form so all three paths stay bit-identical
+    inLo, inHi = inMinMax
+    outLo, outHi = outMinMax
+
+    scale = float((outHi - outLo) if outHi != outLo else 1) / float(
+        (inHi - inLo) if inHi != inLo else 1
+    )
 
     if num is None:
-        num = inMinMax[0] if force else None
+        num = inLo if force else None
 
-    elif num < inMinMax[0] or num > inMinMax[1]:
-        num = min(max(num, inMinMax[0]), inMinMax[1]) if force else None
+    elif num < inLo or num > inHi:
+        num = min(max(num, inLo), inHi) if force else None
 
     if num is None:
         return None
 
-    val = outMinMax[0] + (float(num - inMinMax[0]) / float(deltaInMinMax) * float(deltaOutMinMax))
-    return float(max(min(val, outMinMax[1]), outMinMax[0]))
+    val = outLo + (num - inLo) * scale
+    return float(max(min(val, outHi), outLo))
+
+
+def make_num_to_range(inMinMax, outMinMax, force=False):
+    """Create mapping function with ranges baked in
+
+    Callers that map many values against the same ranges -- e.g. all
+    64 pixels of an 8x8 LED frame -- shouldn't re-validate the ranges
+    and re-derive the scale factor on every call. This returns a small
+    closure with the scale and bounds precomputed, behaving exactly
+    like 'num_to_range' with the given ranges.
+
+    Args:
+        inMinMax:
+            'tuple' with min/max values of range for numbers to be converted
+        outMinMax:
+            'tuple' with min/max value of target range
+        force:
+            'bool' see 'num_to_range'
+
+    Returns:
+        function mapping a single 'num' to the target range
+    """
+    if inMinMax[0] > inMinMax[1]:
+        raise ValueError(f"Invalid 'inMinMax' values: ({inMinMax[0]},{inMinMax[1]})")
+
+    if outMinMax[0] > outMinMax[1]:
+        raise ValueError(f"Invalid 'outMinMax' values: ({outMinMax[0]},{outMinMax[1]})")
+
+    inLo, inHi = inMinMax
+    outLo, outHi = outMinMax
+
+    # NOTE: keep the exact same operation order as 'num_to_range' so
+    #       both paths produce bit-identical floats
+    scale = float((outHi - outLo) if outHi != outLo else 1) / float(
+        (inHi - inLo) if inHi != inLo else 1
+    )
+
+    def mapper(num):
+        if num is None:
+            num = inLo if force else None
+        elif num < inLo or num > inHi:
+            num = min(max(num, inLo), inHi) if force else None
+
+        if num is None:
+            return None
+
+        val = outLo + (num - inLo) * scale
+        return float(max(min(val, outHi), outLo))
+
+    return mapper
+
+
+def num_to_range_batch(nums, inMinMax, outMinMax, force=False):
+    """Map a whole series of values to a range in one vectorized pass
+
+    The documented 'num_to_range' callers map entire buffers -- 8-LED
+    columns, sparkline windows of up to 120 points -- one value at a
+    time. This variant handles the full series with a handful of NumPy
+    operations instead of one interpreted call per element.
+
+    NOTE: missing/out-of-bound values come back as 'np.nan' instead
+          of 'None' since the result is a float array.
+
+    Args:
+        nums: sequence with values to map ('None' items are allowed)
+        inMinMax: 'tuple' with min/max values of input range
+        outMinMax: 'tuple' with min/max values of target range
+        force: 'bool' see 'num_to_range'
+
+    Returns:
+        NumPy 'float64' array with mapped values
+    """
+    if inMinMax[0] > inMinMax[1]:
+        raise ValueError(f"Invalid 'inMinMax' values: ({inMinMax[0]},{inMinMax[1]})")
+
+    if outMinMax[0] > outMinMax[1]:
+        raise ValueError(f"Invalid 'outMinMax' values: ({outMinMax[0]},{outMinMax[1]})")
+
+    inLo, inHi = inMinMax
+    outLo, outHi = outMinMax
+
+    # Same scale-factor form as 'num_to_range' (see NOTE there)
+    scale = float((outHi - outLo) if outHi != outLo else 1) / float(
+        (inHi - inLo) if inHi != inLo else 1
+    )
+
+    if isinstance(nums, np.ndarray):
+        arr = nums.astype(np.float64)
+    else:
+        arr = np.array([np.nan if num is None else num for num in nums], dtype=np.float64)
+
+    if force:
+        arr[np.isnan(arr)] = inLo
+        np.clip(arr, inLo, inHi, out=arr)
+    else:
+        arr[(arr < inLo) | (arr > inHi)] = np.nan
+
+    out = outLo + (arr - inLo) * scale
+    np.clip(out, outLo, outHi, out=out)
+
+    return out
 
 
 def convert_to_rgb(num, inMin, inMax, colors):
@@ -566,8 +1076,6 @@ def convert_to_rgb(num, inMin, inMax, colors):
     Returns:
         'tuple' with RGB value
     """
-    EPSILON = sys.float_info.epsilon  # Smallest possible difference
-
     # Determine where the given value falls proportionality within
     # the range from inMin->inMax and scale that fractional value
     # by the total number in the `colors` palette.
@@ -579,7 +1087,7 @@ def convert_to_rgb(num, inMin, inMax, colors):
     i, f = int(i_f // 1), i_f % 1  # Split into whole & fractional parts.
 
     # Does it fall exactly on one of the color points?
-    if f < EPSILON:
+    if f < _EPSILON:
         return colors[i]
 
     # ... if not, then return a color linearly interpolated in the
@@ -588,6 +1096,155 @@ def convert_to_rgb(num, inMin, inMax, colors):
     return int(r1 + f * (r2 - r1)), int(g1 + f * (g2 - g1)), int(b1 + f * (b2 - b1))
 
 
+def make_rgb_mapper(colors, inMin, inMax):
+    """Create RGB mapping function with palette and range baked in
+
+    Callers that color many values against the same palette and range
+    -- e.g. every pixel of an LED frame -- shouldn't re-measure the
+    palette and re-derive the scale on every call. This returns a
+    small closure with those precomputed, behaving exactly like
+    'convert_to_rgb' with the given arguments.
+
+    Args:
+        colors:
+            series of RGB colors delineating a series of adjacent
+            linear color gradients.
+        inMin:
+            Min value of range for numbers to be converted
+        inMax:
+            Max value of range for numbers to be converted
+
+    Returns:
+        function mapping a single 'num' to an RGB 'tuple'
+    """
+    colorsTuple = tuple(tuple(color) for color in colors)
+    numSegments = len(colorsTuple) - 1
+    deltaIn = float(inMax - inMin)
+
+    # Precompute the per-segment color slopes (strength reduction) so
+    # the mapper interpolates with three multiply-adds instead of
+    # re-deriving the channel deltas on every call.
+    slopes = tuple(
+        (c1[0] - c0[0], c1[1] - c0[1], c1[2] - c0[2])
+        for c0, c1 in zip(colorsTuple, colorsTuple[1:])
+    )
+
+    def mapper(num):
+        # NOTE: keep the exact same operation order as 'convert_to_rgb'
+        #       so both paths produce bit-identical results
+        i_f = float(num - inMin) / deltaIn * numSegments
+        i, f = int(i_f // 1), i_f % 1
+
+        if f < _EPSILON:
+            return colorsTuple[i]
+
+        r1, g1, b1 = colorsTuple[i]
+        dR, dG, dB = slopes[i]
+        return int(r1 + f * dR), int(g1 + f * dG), int(b1 + f * dB)
+
+    return mapper
+
+
+def convert_to_rgb_batch(nums, inMin, inMax, colors):
+    """Map series of numeric values to RGB in one vectorized pass
+
+    Mapping a whole buffer of sensor readings (e.g. an 8x8 LED frame)
+    through 'convert_to_rgb' costs one Python call per value. This
+    variant does the same index/fraction split and linear interpolation
+    with NumPy, traversing the buffer once at C level.
+
+    Args:
+        nums:
+            Series of numbers to convert/map to RGB
+        inMin:
+            Min value of range for numbers to be converted
+        inMax:
+            Max value of range for numbers to be converted
+        colors:
+            series of RGB colors delineating a series of adjacent
+            linear color gradients.
+
+    Returns:
+        'ndarray' with shape '(N, 3)' holding one RGB triple per value
+    """
+    colorArr = np.asarray(colors, dtype=np.float64)
+    numArr = np.asarray(nums, dtype=np.float64)
+
+    # Proportional position of each value within the palette ...
+    i_f = (numArr - inMin) / float(inMax - inMin) * (len(colorArr) - 1)
+
+    # ... split into lower color index and fractional distance ...
+    i = np.floor(i_f).astype(np.intp)
+    f = (i_f - i)[:, None]
+
+    # ... and interpolate between each lower/upper color pair
+    c0 = colorArr[i]
+    c1 = colorArr[np.minimum(i + 1, len(colorArr) - 1)]
+
+    return (c0 + f * (c1 - c0)).astype(np.uint8)
+
+
+@functools.lru_cache(maxsize=8)
+def _make_rgb_lut(colorMap, inMin, inMax, steps):
+    """Build gradient lookup table ... used by 'build_rgb_lut'"""
+    return convert_to_rgb_batch(np.linspace(inMin, inMax, steps), inMin, inMax, colorMap)
+
+
+def build_rgb_lut(colors, inMin, inMax, steps=256):
+    """Build (cached) RGB gradient lookup table
+
+    Display loops that map many values onto the same gradient can
+    skip the per-value interpolation entirely: precompute the whole
+    gradient once and reduce each conversion to a single index. A
+    256-step 'uint8' table is only 768 bytes, so it stays cache-hot.
+
+    Example:
+        lut = build_rgb_lut(colors, 0, 100)
+        idx = min(max(int((num - 0) / 100 * 255), 0), 255)
+        rgb = tuple(lut[idx])
+
+    Args:
+        colors:
+            series of RGB colors delineating a series of adjacent
+            linear color gradients.
+        inMin:
+            Min value of range for numbers to be converted
+        inMax:
+            Max value of range for numbers to be converted
+        steps:
+            'int' with number of gradient steps in the table
+
+    Returns:
+        'ndarray' with shape '(steps, 3)' holding the gradient
+    """
+    return _make_rgb_lut(tuple(tuple(color) for color in colors), inMin, inMax, steps)
+
+
+def convert_to_rgb_lut(num, lut, inMin):
+    """Map numeric value to RGB via a precomputed lookup table
+
+    When sensor values live in a small integer domain (e.g. 0-100
+    humidity), a table built with
+    'build_rgb_lut(colors, inMin, inMax, inMax - inMin + 1)' holds the
+    exact 'convert_to_rgb' result for every whole value, and each
+    conversion collapses to a single array index with no arithmetic.
+
+    Args:
+        num:
+            Number to convert/map to RGB
+        lut:
+            'ndarray' gradient table from 'build_rgb_lut'
+        inMin:
+            Min value of range used to build the table
+
+    Returns:
+        'tuple' with RGB value
+    """
+    r, g, b = lut[int(num) - inMin]
+
+    return int(r), int(g), int(b)
+
+
 def convert_to_bool(inVal):
     """Convert value to boolean.
 
@@ -601,19 +1258,56 @@ def convert_to_bool(inVal):
         inVal:
             Value to be converted to boolean.
     """
+    # Strings are checked before numerics since TOML-sourced
+    # values -- the main use case -- are almost always strings.
     if isinstance(inVal, bool):
         return inVal
+    elif isinstance(inVal, str):
+        return inVal.lower() in _TRUE_STRS
     elif isinstance(inVal, (int, float)):
         return abs(int(inVal)) > 0
-    elif isinstance(inVal, str):
-        return inVal.lower() in [STATUS_ON, STATUS_TRUE, STATUS_YES]
     else:
         return False
 
 
+@functools.lru_cache(maxsize=4)
+def _get_figlet(font):
+    """Get (cached) pyFiglet renderer for a given font
+
+    Creating a 'Figlet' instance reads and parses a font file, which
+    is the expensive part of rendering a logo. Caching the renderer
+    means only the first logo (per font) pays that cost, even when
+    'make_logo' itself misses its cache because the text differs.
+
+    NOTE: pyfiglet is imported here -- not at module top-level -- so
+          that CLI runs which never render a logo (e.g. '--help' or
+          '--version') don't pay its import cost at startup.
+    """
+    from pyfiglet import Figlet
+
+    return Figlet(font=font)
+
+
+@functools.lru_cache(maxsize=32)
+def _render_figlet(appName):
+    """Render (and cache) raw ASCII art lines for a given app name
+
+    'make_logo' memoizes its final output, but its cache misses
+    whenever the console width changes even though the underlying
+    ASCII art is the same. Caching the raw render separately means
+    the (expensive) pyFiglet pass runs once per app name.
+    """
+    return tuple(_get_figlet('slant').renderText(appName).splitlines())
+
+
+@functools.lru_cache(maxsize=8)
 def make_logo(maxWidth, appName, appVer, default=None, center=True):
     """Create a fancy logo using pyFiglet
 
+    NOTE: the output is memoized on the (immutable) arguments, so
+          repeated calls with the same app name, version, and width
+          skip the (relatively expensive) pyFiglet rendering.
+
     This will create a fancy multi-line ASCII-ized logo
     using pyFiglet library and 'slant' font. We'll also
     add in the version number on the last row, and we'll
@@ -637,24 +1331,23 @@ def make_logo(maxWidth, appName, appVer, default=None, center=True):
     Returns:
         'str' with logo. A multiline-logo will have '\n' embedded
     """
-    logoFont = Figlet(font='slant')
-    logoStrArr = logoFont.renderText(appName).splitlines()
-    logoLen = max(len(s) for s in logoStrArr)
+    logoStrArr = list(_render_figlet(appName))
+    logoLen = max(map(len, logoStrArr))
 
     result = default
 
     if logoLen < maxWidth:
-        lastCharPos = logoStrArr[-2].rfind('/')
-        deltaStrLen = (
-            len(logoStrArr[-2]) - lastCharPos
-            if lastCharPos >= 0
-            else len(logoStrArr[-2]) - len(appVer)
-        )
-        logoStrArr[-1] = (
-            logoStrArr[-1][: -(len(appVer) + deltaStrLen)] + appVer + (' ' * deltaStrLen)
+        lastLine = logoStrArr[-2]
+        lastLineLen = len(lastLine)
+        lastCharPos = lastLine.rfind('/')
+        deltaStrLen = lastLineLen - (lastCharPos if lastCharPos >= 0 else len(appVer))
+        tail = logoStrArr[-1]
+        logoStrArr[-1] = f"{tail[: -(len(appVer) + deltaStrLen)]}{appVer}{' ' * deltaStrLen}"
+        result = (
+            '\n'.join(s.center(maxWidth, ' ').rstrip() for s in logoStrArr)
+            if center
+            else '\n'.join(logoStrArr)
         )
-        newLogo = [s.center(maxWidth, ' ').rstrip() for s in logoStrArr] if center else logoStrArr
-        result = '\n'.join(newLogo)
 
     return result
 
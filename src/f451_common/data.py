@@ -30,13 +30,11 @@ import time
 import sys
 import asyncio
 from abc import ABC, abstractmethod
+from collections import ChainMap
 from pathlib import Path
 from random import randint
 
-try:
-    import tomllib
-except ModuleNotFoundError:
-    import tomli as tomllib
+from ._toml import tomllib
 
 import gspread
 
@@ -155,8 +153,17 @@ class GoogleSheet(Spreadsheet):
 
         # We combine 'args' and 'kwargs' to allow users to provide the entire
         # 'config' object and/or individual settings (which could override
-        # values in 'config').
-        settings = {**args[0], **kwargs} if args and isinstance(args[0], dict) else kwargs
+        # values in 'config'). 'ChainMap' gives kwargs precedence without
+        # copying/rehashing the (potentially large) 'config' dict.
+        if args and isinstance(args[0], dict):
+            settings = ChainMap(kwargs, args[0]) if kwargs else args[0]
+        else:
+            settings = kwargs
+
+        # Cache resolved worksheet handles. Every lookup via gSpread is
+        # an HTTP round-trip to Google, and the read/write methods are
+        # usually called against the same worksheet over and over.
+        self._wrkShtCache = {}
 
         active = False
         gcSA = None
@@ -178,27 +185,62 @@ class GoogleSheet(Spreadsheet):
         if gcSA and sht:
             super().__init__(sht, defWrkSht, active)
 
-    def read_data_from_cell(self, cell, wrkSheet=None):
-        wrkSheet = self._defWrkSht if wrkSheet is None else wrkSheet
+    def _resolve_worksheet(self, wrkSheet):
+        """Resolve (cached) worksheet handle
+
+        Worksheets can be referenced by index ('int') or name ('str').
+        We only ask gSpread -- i.e. pay the network round-trip -- for
+        a given worksheet once and serve the handle from cache after
+        that. Unsupported reference types resolve to 'None'.
+        """
+        if wrkSheet is None:
+            wrkSheet = self._defWrkSht
+
+        objWrkSheet = self._wrkShtCache.get(wrkSheet)
+        if objWrkSheet is not None:
+            return objWrkSheet
 
-        objWrkSheet = None
         if isinstance(wrkSheet, int):
             objWrkSheet = self._spreadsheet.get_worksheet(wrkSheet)
         elif isinstance(wrkSheet, str):
             objWrkSheet = self._spreadsheet.worksheet(wrkSheet)
 
+        if objWrkSheet is not None:
+            self._wrkShtCache[wrkSheet] = objWrkSheet
+
+        return objWrkSheet
+
+    def read_data_from_cell(self, cell, wrkSheet=None):
+        objWrkSheet = self._resolve_worksheet(wrkSheet)
+
         return objWrkSheet.acell(cell).value if objWrkSheet is not None else None
 
     def read_data_from_range(self, cellRange, wrkSheet=None):
-        wrkSheet = self._defWrkSht if wrkSheet is None else wrkSheet
+        return self._resolve_worksheet(wrkSheet).get_values(cellRange)
 
-        objWrkSheet = None
-        if isinstance(wrkSheet, int):
-            objWrkSheet = self._spreadsheet.get_worksheet(wrkSheet)
-        elif isinstance(wrkSheet, str):
-            objWrkSheet = self._spreadsheet.worksheet(wrkSheet)
+    def read_data_from_ranges(self, cellRanges, wrkSheet=None):
+        """Read values from several cell ranges in one API call
+
+        Reading N ranges via 'read_data_from_range' costs N HTTP
+        round-trips. This method uses gSpread's native 'batch_get'
+        so all ranges come back in a single request.
+
+        Args:
+            cellRanges: sequence of cell range strings (e.g. 'A1:B2')
+            wrkSheet: optional worksheet name ('str') or index ('int')
 
-        return objWrkSheet.get_values(cellRange)
+        Returns:
+            'list' with one list of values per requested range
+        """
+        return self._resolve_worksheet(wrkSheet).batch_get(list(cellRanges))
+
+    async def aread_data_from_ranges(self, cellRanges, wrkSheet=None):
+        """Async wrapper around 'read_data_from_ranges'
+
+        The underlying gSpread call is blocking, so we run it in a
+        worker thread to keep the event loop responsive.
+        """
+        return await asyncio.to_thread(self.read_data_from_ranges, cellRanges, wrkSheet)
 
     def write_data_to_cell(self, cell, worksheet):
         pass
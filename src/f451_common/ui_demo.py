@@ -28,6 +28,7 @@ import sys
 import asyncio
 import contextlib
 import platform
+import threading
 
 from datetime import datetime
 from pathlib import Path
@@ -62,8 +63,10 @@ APP_SETTINGS = 'ui_demo_settings.toml' # Settings for demo
 
 APP_MIN_SENSOR_READ_WAIT = 1        # Min wait in sec between sensor reads
 APP_MIN_PROG_WAIT = 1               # Remaining min (loop) wait time to display prog bar
+APP_UI_REFRESH = 0.25               # Min time in sec between UI progress refreshes
 APP_WAIT_1SEC = 1
 APP_MAX_DATA = 120                  # Max number of data points in the queue
+APP_MAX_BATCH = 32                  # Max number of data points per upload batch
 APP_DELTA_FACTOR = 0.02             # Any change within X% is considered negligable
 
 APP_DATA_TYPES = [
@@ -137,6 +140,9 @@ class AppRT(f451Common.Runtime):
         self.maxUploads = int(cliArgs.uploads)
         self.numUploads = 0
         self.loopWait = APP_WAIT_1SEC   # Wait time between main loop cycles
+        self.uploadPending = None       # In-flight background upload, if any
+        self.uploadBatch = []           # Data points queued for next upload
+        self.deviceID = f451Common.get_RPI_ID(f451Common.DEF_ID_PREFIX)
 
         # Initialize UI for terminal
         if cliArgs.noCLI:
@@ -241,10 +247,38 @@ appRT = AppRT(APP_NAME, APP_VERSION, APP_NAME_SHORT, APP_LOG, APP_SETTINGS)
 # =========================================================
 #              H E L P E R   F U N C T I O N S
 # =========================================================
+# Long-lived event loop for background uploads. Spinning up a fresh
+# loop via 'asyncio.run' on every upload tick blocks 'main_loop' (and
+# freezes the Rich 'Live' UI) for the duration of the upload. Instead
+# we run one loop in a daemon thread and hand coroutines to it, so the
+# polling loop only pays for a non-blocking submit.
+_uploadLoop = None
+
+
+def _get_upload_loop():
+    """Start (once) and return the background upload event loop"""
+    global _uploadLoop
+
+    if _uploadLoop is None:
+        _uploadLoop = asyncio.new_event_loop()
+        threading.Thread(
+            target=_uploadLoop.run_forever,
+            name='uploadWorker',
+            daemon=True,
+        ).start()
+
+    return _uploadLoop
+
+
 async def send_data(*args):
-    """Fake 'send' function"""
-    print('Fake upload start ...')
-    time.sleep(5)
+    """Fake 'send' function
+
+    A real sender would issue one multi-point POST here (e.g. the
+    Adafruit IO batch endpoint) instead of one request per point.
+    """
+    numPts = len(args[0]) if args and isinstance(args[0], (list, tuple)) else 1
+    print(f'Fake upload start ({numPts} data points) ...')
+    await asyncio.sleep(5)
     print('... fake upload end')
 
 
@@ -269,11 +303,45 @@ async def upload_demo_data(*args, **kwargs):
 
     # Send download speed data ?
     if upload.get('data') is not None:
-        sendQ.append(send_data(upload.get('data')))  # type: ignore
+        # Wrap in a proper task so cancellation propagates cleanly
+        sendQ.append(asyncio.create_task(send_data(upload.get('data'))))  # type: ignore
 
     # deviceID = appRT.sensors['SenseHat'].get_ID(DEF_ID_PREFIX)
 
-    await asyncio.gather(*sendQ)
+    # Let every send run to completion before surfacing a failure so
+    # one bad feed doesn't mask the others mid-flight
+    results = await asyncio.gather(*sendQ, return_exceptions=True)
+
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+
+
+async def upload_with_retry(payload, maxAttempts=3):
+    """Upload with retry and exponential backoff
+
+    Transient network errors shouldn't cost us a whole batch of data
+    points. We retry a failed upload a few times -- waiting 1s, 2s,
+    4s, ... between attempts -- before giving up. Since this runs on
+    the background upload loop, the backoff never stalls the main
+    polling loop.
+
+    Args:
+        payload: 'dict' with kwargs for 'upload_demo_data'
+        maxAttempts: 'int' with max number of upload attempts
+    """
+    for attempt in range(maxAttempts):
+        try:
+            await upload_demo_data(**payload)
+            return
+
+        except Exception as e:
+            if attempt + 1 >= maxAttempts:
+                raise
+            appRT.logger.log_warning(
+                f'Upload attempt {attempt + 1} failed: {e} - retrying in {2**attempt}s'
+            )
+            await asyncio.sleep(2**attempt)
 
 
 def init_cli_parser(appName, appVersion, setDefaults=True):
@@ -327,6 +395,11 @@ def collect_data(app, data, timeCurrent, cliUI=False):
     Returns:
         'bool' if 'True' then we're done with all loops and we can exit app
     """
+    # Bail right away if we've already hit the upload cap -- no point
+    # reading another sample just to throw it away
+    if app.maxUploads > 0 and app.numUploads >= app.maxUploads:
+        return True
+
     exitApp = False
 
     # --- Get magic data ---
@@ -336,31 +409,52 @@ def collect_data(app, data, timeCurrent, cliUI=False):
     #
     # ----------------------
 
-    # Is it time to upload data?
-    if app.timeSinceUpdate >= app.uploadDelay:
-        try:
-            asyncio.run(
-                upload_demo_data(
-                    data=newData.rndnum,
-                    deviceID=f451Common.get_RPI_ID(f451Common.DEF_ID_PREFIX),
-                )
-            )
+    # Queue new sample for the next upload. The batch is capped so a
+    # long outage can't grow memory unbounded -- oldest points drop.
+    app.uploadBatch.append(newData.rndnum)
+    del app.uploadBatch[:-APP_MAX_BATCH]
+
+    # Is it time to upload data? We send everything batched since the
+    # last upload in one call -- one request instead of one per point --
+    # submit to the background loop, and return immediately. Only one
+    # upload is in flight at a time.
+    if app.timeSinceUpdate >= app.uploadDelay and app.uploadPending is None:
+        batch = list(app.uploadBatch)
+        app.uploadBatch.clear()
+
+        future = asyncio.run_coroutine_threadsafe(
+            upload_with_retry(
+                {
+                    'data': batch,
+                    'deviceID': app.deviceID,
+                }
+            ),
+            _get_upload_loop(),
+        )
+        app.uploadPending = (future, batch)
+        app.timeUpdate = timeCurrent
+        app.update_action(cliUI, None)
 
-        except KeyboardInterrupt:
-            exitApp = True
+    # Bookkeeping for a finished background upload. This runs on the
+    # main thread so the Rich UI is never touched from the worker.
+    if app.uploadPending is not None and app.uploadPending[0].done():
+        future, uploadedVals = app.uploadPending
+        app.uploadPending = None
 
-        else:
+        if future.exception() is None:
             # Reset 'uploadDelay' back to normal 'ioFreq' on successful upload
             app.numUploads += 1
             app.uploadDelay = app.ioFreq
             exitApp = exitApp or app.ioUploadAndExit
-            app.logger.log_info(f'Uploaded: Magic #: {round(newData.rndnum, app.ioRounding)}')
+            app.logger.log_info(
+                f'Uploaded {len(uploadedVals)} data points - '
+                f'Magic #: {round(uploadedVals[-1], app.ioRounding)}'
+            )
             app.update_upload_status(cliUI, timeCurrent, f451CLIUI.HTTP_STATUS_OK)
+        else:
+            app.logger.log_error(f'Upload failed: {future.exception()}')
 
-        finally:
-            app.timeUpdate = timeCurrent
-            exitApp = (app.maxUploads > 0) and (app.numUploads >= app.maxUploads)
-            app.update_action(cliUI, None)
+        exitApp = exitApp or ((app.maxUploads > 0) and (app.numUploads >= app.maxUploads))
 
     # Update data set and display to terminal as needed
     data.rndnum.data.append(newData.rndnum)
@@ -386,36 +480,56 @@ def main_loop(app, data, cliUI=False):
     # Set 'wait' counter 'exit' flag and start the loop!
     exitApp = False
     waitForSensor = 0
+    lastUIRefresh = 0
+
+    # Bind loop-invariant settings as locals -- both are fixed after
+    # 'init_runtime', and locals skip the per-tick attribute lookups
+    ioWait = app.ioWait
+    loopWait = app.loopWait
+
+    # Pace the loop on absolute monotonic deadlines. A plain
+    # 'sleep(loopWait)' drifts because sleep overshoot and UI work
+    # add to every cycle; sleeping toward the next deadline keeps
+    # the sample cadence stable.
+    deadline = time.monotonic()
 
     while not exitApp:
         try:
             timeCurrent = time.time()
             app.timeSinceUpdate = timeCurrent - app.timeUpdate
 
-            # Do we need to wait for next sensor read?
+            # Do we need to wait for next sensor read? The progress
+            # bar redraw is throttled on its own cadence so 'loopWait'
+            # can shrink for faster sensor reads without drowning the
+            # terminal in redraws.
             if waitForSensor > 0:
-                app.update_progress(cliUI, int((1 - waitForSensor / app.ioWait) * 100))
+                if timeCurrent - lastUIRefresh >= APP_UI_REFRESH:
+                    app.update_progress(cliUI, int((1 - waitForSensor / ioWait) * 100))
+                    lastUIRefresh = timeCurrent
 
             # ... or can we collect more 'specimen'? :-P
             else:
                 app.update_action(cliUI, None)
                 exitApp = collect_data(app, data, timeCurrent, cliUI)
-                waitForSensor = max(app.ioWait, APP_MIN_PROG_WAIT)
-                if app.ioWait > APP_MIN_PROG_WAIT:
+                waitForSensor = max(ioWait, APP_MIN_PROG_WAIT)
+                if ioWait > APP_MIN_PROG_WAIT:
                     app.update_progress(cliUI, None, 'Warming up magic 8-ball')
 
-            # Update UI and SenseHAT LED as needed
-            app.update_data(
-                cliUI, f451CLIUI.prep_data(data.as_dict(), APP_DATA_TYPES, APP_DELTA_FACTOR)
-            )
+            # NOTE: no display update here -- 'collect_data' already
+            #       pushes fresh data to the UI when a new sample is
+            #       read, and during wait ticks nothing has changed
+            #       except the progress bar (updated above). Running
+            #       'prep_data' again every tick just rebuilt the
+            #       exact same rows.
 
         except KeyboardInterrupt:
             exitApp = True
 
         # Are we done?
         if not exitApp:
-            time.sleep(app.loopWait)
-            waitForSensor -= app.loopWait
+            deadline += loopWait
+            time.sleep(max(0, deadline - time.monotonic()))
+            waitForSensor -= loopWait
 
 
 # =========================================================
@@ -438,6 +552,13 @@ def main(cliArgs=None):
     """
     global appRT
 
+    # Fast-path version requests so scripted invocations don't pay
+    # for building the full ArgParse parser just to print one line
+    argv = sys.argv[1:] if cliArgs is None else cliArgs
+    if argv and set(argv) <= {'-V', '--version'}:
+        print(f'{APP_NAME} (v{APP_VERSION})')
+        sys.exit(0)
+
     # Parse CLI args and show 'help' and exit if no args
     cli = init_cli_parser(APP_NAME, APP_VERSION, True)
     cliArgs, _ = cli.parse_known_args(cliArgs)
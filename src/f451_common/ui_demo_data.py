@@ -6,8 +6,8 @@ design of SenseHat Data object, but is customized for
 random demo data collected in the demo application.
 """
 
-from collections import deque
 import f451_sensehat.sensehat_data as f451SenseData
+import f451_common.common as f451Common
 
 
 # =========================================================
@@ -38,14 +38,14 @@ class DemoData:
             'dict' - holds entiure data structure
         """
         self.rndnum = f451SenseData.SenseObject(
-            deque([defVal] * maxLen, maxlen=maxLen),
+            f451Common.make_history(maxLen, defVal),
             (45, 155),  # min/max range for valid data
             'km/h',
             [55, 85, 115, 145],
             'Speed',
         )
         self.rndpcnt = f451SenseData.SenseObject(
-            deque([defVal] * maxLen, maxlen=maxLen),
+            f451Common.make_history(maxLen, defVal),
             (0, 100),  # min/max range for valid data
             '%',
             [10, 30, 70, 90],
@@ -1,11 +1,19 @@
 """Test cases for f451 Labs Common module."""
 
+import math
+
 import pytest
+import numpy as np
 from pathlib import Path
 
 import src.f451_common.common as common
 
 
+# Sample palette and values shared by the scalar/batch parity tests
+TEST_COLORS = ((0, 0, 255), (0, 255, 0), (255, 255, 0), (255, 0, 0))
+TEST_NUMS = [0, 1, 9.5, 10, 13.7, 17.2, 20, 25.1, 50, 99, 100]
+
+
 # =========================================================
 #          F I X T U R E S   A N D   H E L P E R S
 # =========================================================
@@ -25,7 +33,9 @@ def test_debug(capsys, valid_str):
 
 def test_load_settings():
     APP_DIR = Path(__file__).parent         # Find dir for this app
-    settings = common.load_settings(APP_DIR.joinpath("test.toml"))
+    # Skip caches so we always exercise the TOML parser and don't
+    # leave a 'test.toml.cache' artifact in the source tree
+    settings = common.load_settings(APP_DIR.joinpath("test.toml"), useCache=False)
     assert settings.get("FOO") == "bar"
 
 
@@ -51,6 +61,31 @@ def test_num_to_range():
     assert val == 10.0
 
 
+def test_get_delta_range():
+    assert common.get_delta_range(110, 100, 0.02) == 1
+    assert common.get_delta_range(100, 100, 0.02) == 0
+    assert common.get_delta_range(90, 100, 0.02) == -1
+    assert common.get_delta_range(None, 100, 0.02) == 0
+
+    # Negative references invert the '(1 +/- factor)' band, and we
+    # classify against the actual bounds -- equal pairs are 'within'
+    assert common.get_delta_range(-90, -100, 0.02) == 1
+    assert common.get_delta_range(-100, -100, 0.02) == 0
+    assert common.get_delta_range(-110, -100, 0.02) == -1
+
+
+def test_temp_compensate():
+    # Standard Enviro+/luftdaten formula: raw - ((avgCpu - raw) / factor)
+    val = common.temp_compensate(30.0, [50.0, 50.0, 50.0], common.DEF_TEMP_COMP_FACTOR)
+    assert val == pytest.approx(30.0 - (20.0 / 2.25))
+
+    # Lower factor means more correction
+    assert common.temp_compensate(30.0, [50.0], 1.0) < common.temp_compensate(30.0, [50.0], 2.0)
+
+    # No CPU heat bleed means no correction
+    assert common.temp_compensate(30.0, [30.0, 30.0], 2.25) == pytest.approx(30.0)
+
+
 @pytest.mark.parametrize("data_in_range",[i for i in range(100)])
 def test_num_to_range_multi(data_in_range):
     val = common.num_to_range(data_in_range, (0, 100), (0, 100))
@@ -105,3 +140,91 @@ def test_convert_to_bool_fail():
     assert not common.convert_to_bool([True])
     assert not common.convert_to_bool((0,0))
     assert not common.convert_to_bool({"foo":"bar"})
+
+
+def test_signature_compat():
+    # Guard against re-introducing duplicate definitions with diverging
+    # signatures. Both legacy call styles must resolve to the same single
+    # definition with optional kwargs defaulting to legacy behavior.
+    import inspect
+
+    triColorParams = inspect.signature(common.get_tri_colors).parameters
+    assert triColorParams["colors"].default is None
+    assert triColorParams["asRGB"].default is False
+
+    isValidParams = inspect.signature(common.is_valid).parameters
+    assert isValidParams["allowNone"].default is True
+
+    assert common.get_tri_colors() == common.get_tri_colors(None, False)
+    assert common.is_valid(None, (0, 100)) == common.is_valid(None, (0, 100), True)
+
+
+# =========================================================
+#    S C A L A R  /  B A T C H   P A R I T Y   T E S T S
+# =========================================================
+# The batch/factory/LUT variants all promise the same results as
+# their scalar counterparts. These tests pin that parity so the
+# vectorized paths can't silently drift.
+@pytest.mark.parametrize("force", [False, True])
+@pytest.mark.parametrize(
+    "in_min_max, out_min_max",
+    [((0, 100), (0, 8)), ((10, 20), (0, 100)), ((-40, 60), (0, 255))],
+)
+def test_num_to_range_parity(in_min_max, out_min_max, force):
+    nums = TEST_NUMS + [None]
+    mapper = common.make_num_to_range(in_min_max, out_min_max, force)
+    batch = common.num_to_range_batch(nums, in_min_max, out_min_max, force)
+
+    for num, batchVal in zip(nums, batch):
+        scalarVal = common.num_to_range(num, in_min_max, out_min_max, force)
+        assert mapper(num) == scalarVal
+
+        # Batch variant returns 'np.nan' where scalar returns 'None'
+        if scalarVal is None:
+            assert math.isnan(batchVal)
+        else:
+            assert batchVal == scalarVal
+
+
+def test_convert_to_rgb_parity():
+    nums = [num for num in TEST_NUMS if 0 <= num <= 100]
+    mapper = common.make_rgb_mapper(TEST_COLORS, 0, 100)
+    batch = common.convert_to_rgb_batch(nums, 0, 100, TEST_COLORS)
+
+    for num, batchVal in zip(nums, batch):
+        scalarVal = common.convert_to_rgb(num, 0, 100, TEST_COLORS)
+        assert mapper(num) == scalarVal
+        assert tuple(int(ch) for ch in batchVal) == scalarVal
+
+
+def test_convert_to_rgb_lut_parity():
+    # One LUT entry per whole value makes the table exact for ints
+    lut = common.build_rgb_lut(TEST_COLORS, 0, 100, steps=101)
+
+    for num in range(0, 101):
+        assert common.convert_to_rgb_lut(num, lut, 0) == common.convert_to_rgb(
+            num, 0, 100, TEST_COLORS
+        )
+
+
+@pytest.mark.parametrize("second", [100, -100, 0.5, None])
+def test_get_delta_range_batch_parity(second):
+    values = [-110, -100, -90, 0, 0.49, 0.51, 90, 100, 110]
+    batch = common.get_delta_range_batch(values, second, 0.02)
+
+    for val, batchVal in zip(values, batch):
+        assert batchVal == common.get_delta_range(val, second, 0.02)
+
+
+@pytest.mark.parametrize("valid", [(10, 20), None, (None, None)])
+def test_is_valid_array_parity(valid):
+    values = [9, 10, 15, 20, 21, None, np.nan]
+    mask = common.is_valid_array(values, valid)
+
+    for val, maskVal in zip(values, mask):
+        if val is None or (isinstance(val, float) and math.isnan(val)):
+            # Documented divergence: the array variant always flags
+            # missing values as invalid (they can't be displayed)
+            assert not maskVal
+        else:
+            assert maskVal == common.is_valid(val, valid)